@@ -0,0 +1,66 @@
+import io
+import time
+import argparse
+
+from reportlab.platypus import Paragraph, Table
+
+from peakrdl.pdf.pdf_creator import PDFCreator
+
+############################################################################
+# Micro-benchmark of the fixed-format table cells (Bits, Access, Reset of
+# the fields table)
+#
+# Each cell is created either as a Paragraph or with create_value_cell
+# (plain string drawn by the table), then the rows are laid out as one
+# table. Prints the cells per second of both.
+############################################################################
+
+def get_row_values(row_id: int) -> list:
+    """
+    Bits, Access and Reset of one field row
+    """
+
+    lsb = row_id % 32
+    return ["[%d:%d]" % (31, lsb), "RW", "32'h%04x_%04x" % (row_id >> 16, row_id & 0xffff)]
+
+
+def run(creator: PDFCreator, rows: int, value_cells: bool) -> tuple:
+    """
+    Returns the (creation, layout) rate in cells per second
+    """
+
+    col_widths = creator.field_list_col_widths[:3]
+    style = creator.styleSheet["BodyTextP"]
+
+    start_time = time.perf_counter()
+    data = []
+    for row_id in range(rows):
+        row = []
+        for col, text in enumerate(get_row_values(row_id)):
+            if value_cells:
+                row.append(creator.create_value_cell(text, col_widths[col]))
+            else:
+                row.append(Paragraph(text, style))
+        data.append(row)
+    creation_time = time.perf_counter() - start_time
+
+    table = Table(data, colWidths=col_widths, style=creator.get_value_cell_style())
+    start_time = time.perf_counter()
+    table.wrap(sum(col_widths), 1e9)
+    layout_time = time.perf_counter() - start_time
+
+    cells = rows * len(col_widths)
+    return (cells / creation_time, cells / layout_time)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cells per second of the table value cells")
+    parser.add_argument("--rows", type=int, default=20000, help="number of table rows")
+    args = parser.parse_args()
+
+    creator = PDFCreator(io.BytesIO())
+
+    for name, value_cells in (("Paragraph", False), ("value cell", True)):
+        creation_rate, layout_rate = run(creator, args.rows, value_cells)
+        print("%-10s  creation %10.0f cells/s  layout %10.0f cells/s" %
+              (name, creation_rate, layout_rate))
@@ -0,0 +1,97 @@
+import sys
+import random
+
+############################################################################
+# Generator of synthetic SystemRDL designs with controlled sizes
+#
+#   maps        - number of address maps
+#   regs        - registers per address map
+#   fields      - fields per register (32 bit registers)
+#   array_size  - elements of one register array added to each map
+#                 (0 - no array)
+#   gap_density - fraction of the register slots left reserved
+#   max_gap     - if set, each reserved slot is a gap of a random power of
+#                 2 bytes up to max_gap (sparse maps, e.g. 2**48), instead
+#                 of 4 bytes
+############################################################################
+def generate_rdl(maps: int, regs: int, fields: int, array_size: int = 0,
+                 gap_density: float = 0.0, max_gap: int = 0, seed: int = 0) -> str:
+
+    rnd = random.Random(seed)
+
+    # Bits of each field (the last field takes the remaining bits)
+    fields = max(1, min(fields, 32))
+    field_width = 32 // fields
+
+    lines = []
+
+    # One reg definition per register slot index, shared by all the maps
+    for reg_id in range(regs):
+        lines.append("reg bench_reg%d_t {" % reg_id)
+        lines.append('    name = "Register %d";' % reg_id)
+        lines.append('    desc = "Synthetic register %d of the benchmark design";' % reg_id)
+
+        for field_id in range(fields):
+            lsb = field_id * field_width
+            msb = 31 if field_id == fields - 1 else lsb + field_width - 1
+            access = rnd.choice(["sw=rw;", "sw=r;", "sw=rw; onwrite=woclr;"])
+            lines.append('    field { %s hw=rw; desc = "Field %d"; } f%d[%d:%d] = %d;' %
+                         (access, field_id, field_id, msb, lsb, rnd.randrange(2)))
+
+        lines.append("};")
+        lines.append("")
+
+    # Size of each map, the maps are placed one after the other
+    map_sizes = []
+
+    # Gap sizes of the sparse maps (powers of 2, from 4 bytes to max_gap)
+    gap_sizes = [4 << i for i in range(max(max_gap // 4, 1).bit_length())]
+
+    for map_id in range(maps):
+        lines.append("addrmap bench_map%d_t {" % map_id)
+        lines.append('    name = "Benchmark map %d";' % map_id)
+
+        offset = 0
+        for reg_id in range(regs):
+            # Reserved slots in between the registers
+            while rnd.random() < gap_density:
+                offset += rnd.choice(gap_sizes) if max_gap else 4
+            lines.append("    bench_reg%d_t r%d @ 0x%x;" % (reg_id, reg_id, offset))
+            offset += 4
+
+        if array_size:
+            lines.append("    bench_reg0_t table[%d] @ 0x%x += 0x4;" % (array_size, offset))
+            offset += array_size * 4
+
+        map_sizes.append(offset)
+
+        lines.append("};")
+        lines.append("")
+
+    # Top address map with all the maps, on 1MB boundaries
+    lines.append("addrmap bench_top {")
+    offset = 0
+    for map_id in range(maps):
+        lines.append("    bench_map%d_t map%d @ 0x%x;" % (map_id, map_id, offset))
+        offset += (map_sizes[map_id] + 0xfffff) // 0x100000 * 0x100000
+    lines.append("};")
+
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 5:
+        print("Usage: python generate_rdl.py <output_rdl> <maps> <regs> <fields> "
+              "[array_size] [gap_density] [max_gap]")
+        sys.exit(1)
+
+    output_file = sys.argv[1]
+    maps, regs, fields = (int(x) for x in sys.argv[2:5])
+    array_size = int(sys.argv[5]) if len(sys.argv) > 5 else 0
+    gap_density = float(sys.argv[6]) if len(sys.argv) > 6 else 0.0
+    max_gap = int(sys.argv[7], 0) if len(sys.argv) > 7 else 0
+
+    with open(output_file, "w") as f:
+        f.write(generate_rdl(maps, regs, fields, array_size, gap_density, max_gap))
+
+    print("Generated the input file - %s " % output_file)
@@ -0,0 +1,57 @@
+import sys
+import subprocess
+import argparse
+
+############################################################################
+# Import time of peakrdl.pdf (python -X importtime)
+#
+# Fails if importing the package loads reportlab (it must only be loaded
+# by the first export) or if the import takes longer than --max-ms
+############################################################################
+def measure_import(module: str) -> list:
+    """
+    Returns the (self us, cumulative us, module) of all the imported modules
+    """
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module],
+                            stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        imports.append((int(self_us), int(cumulative_us), name.strip()))
+
+    return imports
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the import time of peakrdl.pdf")
+    parser.add_argument("--module", default="peakrdl.pdf", help="module to import")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="fail if the import takes longer (cumulative)")
+    parser.add_argument("--top", type=int, default=10, help="number of the slowest modules shown")
+    args = parser.parse_args()
+
+    imports = measure_import(args.module)
+    total_us = max(cumulative_us for self_us, cumulative_us, name in imports)
+
+    print("import %s: %.1f ms" % (args.module, total_us / 1000))
+    print("Slowest modules (self time):")
+    for self_us, cumulative_us, name in sorted(imports, reverse=True)[:args.top]:
+        print("    %-40s %8.1f ms" % (name, self_us / 1000))
+
+    failed = False
+
+    reportlab_modules = [name for self_us, cumulative_us, name in imports
+                         if name == "reportlab" or name.startswith("reportlab.")]
+    if reportlab_modules:
+        print("FAIL - reportlab is imported (%d modules)" % len(reportlab_modules))
+        failed = True
+
+    if args.max_ms is not None and total_us / 1000 > args.max_ms:
+        print("FAIL - the import takes longer than %.1f ms" % args.max_ms)
+        failed = True
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,169 @@
+import os
+import json
+import time
+import argparse
+import datetime
+import platform
+import tempfile
+
+from systemrdl import RDLCompiler
+from peakrdl.pdf import PDFExporter, Instrumentation, __version__
+
+from generate_rdl import generate_rdl
+
+this_dir = os.path.dirname(os.path.realpath(__file__))
+
+# The page templates load the logo relative to the examples directory
+os.chdir(os.path.join(this_dir, "../examples"))
+
+############################################################################
+# Benchmark cases
+# name: (maps, regs per map, fields per reg, array size, gap density,
+#        roots, max gap)
+#
+# roots exports the design that many times as separate roots (the time per
+# root should not grow with the number of roots, compare with "small").
+# max gap makes sparse maps (see generate_rdl)
+############################################################################
+CASES = {
+    "small":  (2, 50, 4, 0, 0.0, 1, 0),
+    "medium": (4, 200, 8, 64, 0.2, 1, 0),
+    "large":  (8, 500, 8, 256, 0.2, 1, 0),
+    "roots":  (2, 50, 4, 0, 0.0, 16, 0),
+    "sparse": (2, 50, 4, 0, 0.5, 1, 2**48),
+}
+
+############################################################################
+# Time each stage of the export of one case
+############################################################################
+def run_case(name: str, params: tuple, tmp_dir: str) -> dict:
+    maps, regs, fields, array_size, gap_density, roots, max_gap = params
+
+    input_file = os.path.join(tmp_dir, name + ".rdl")
+    output_file = os.path.join(tmp_dir, name + ".pdf")
+
+    with open(input_file, "w") as f:
+        f.write(generate_rdl(maps, regs, fields, array_size, gap_density, max_gap))
+
+    stages = {}
+
+    # Compile and elaborate (once per root)
+    start_time = time.time()
+    root_list = []
+    for root_id in range(roots):
+        rdlc = RDLCompiler()
+        rdlc.compile_file(input_file)
+        root_list.append(rdlc.elaborate())
+    stages['compile'] = time.time() - start_time
+
+    instrumentation = Instrumentation()
+    exporter = PDFExporter()
+    exporter.set_export_options({'progress_callback': lambda done, total: None,
+                                 'instrumentation': instrumentation})
+
+    # Extraction of the address maps
+    start_time = time.time()
+    jobs = list(exporter.iter_jobs(root_list))
+    stages['extract'] = time.time() - start_time
+
+    # Rendering, the stages are timed by the instrumentation of the
+    # exporter (the write stage is the serialization of the PDF file)
+    exporter.render_jobs(jobs, output_file)
+
+    totals = instrumentation.get_totals()
+    for stage in ("address check", "flowables", "layout", "write"):
+        stages[stage] = totals.get(stage, 0.0)
+
+    return {
+        'name': name,
+        'maps': maps,
+        'regs': regs,
+        'fields': fields,
+        'array_size': array_size,
+        'gap_density': gap_density,
+        'roots': roots,
+        'max_gap': max_gap,
+        'registers': sum(len(addrmap.registers) for root_id, addrmap in jobs),
+        'pages': exporter.pdf_create.doc.page,
+        'layout_passes': len(exporter.build_pass_times),
+        'bytes': os.path.getsize(output_file),
+        'stages': stages,
+        'total': sum(stages.values()),
+    }
+
+############################################################################
+# Print the results, compared with the previous run (if any)
+############################################################################
+def print_results(run: dict, previous: dict):
+    previous_cases = {}
+    if previous is not None:
+        previous_cases = {case['name']: case for case in previous['cases']}
+
+    for case in run['cases']:
+        roots = case.get('roots', 1)
+        print("%s (%d registers, %d pages, %d root(s))" %
+              (case['name'], case['registers'], case['pages'], roots))
+
+        for stage, duration in list(case['stages'].items()) + [('total', case['total'])]:
+            line = "    %-14s %8.3fs" % (stage, duration)
+
+            previous_case = previous_cases.get(case['name'])
+            if previous_case is not None:
+                if stage == 'total':
+                    previous_duration = previous_case['total']
+                else:
+                    previous_duration = previous_case['stages'].get(stage)
+                if previous_duration:
+                    line += "  (%+.1f%%)" % ((duration / previous_duration - 1) * 100)
+
+            print(line)
+
+        if roots > 1:
+            print("    %-14s %8.3fs" % ("per root", case['total'] / roots))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the stages of the PDF export")
+    parser.add_argument("cases", nargs="*", default=["small", "medium"],
+                        help="cases to run (%s) or "
+                             "maps:regs:fields:array_size:gap_density[:roots[:max_gap]]"
+                             % ", ".join(CASES))
+    parser.add_argument("--results", default=os.path.join(this_dir, "results.json"),
+                        help="JSON file the results are appended to")
+    args = parser.parse_args()
+
+    # Previous runs
+    history = []
+    if os.path.exists(args.results):
+        with open(args.results) as f:
+            history = json.load(f)
+
+    run = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'version': __version__,
+        'python': platform.python_version(),
+        'cases': [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for case in args.cases:
+            if case in CASES:
+                params = CASES[case]
+            else:
+                values = case.split(":")
+                if not 5 <= len(values) <= 7:
+                    parser.error("Not a valid case '%s'" % case)
+                values += ["1", "0"][len(values)-5:]
+                params = (int(values[0]), int(values[1]), int(values[2]),
+                          int(values[3]), float(values[4]), int(values[5]),
+                          int(values[6], 0))
+
+            run['cases'].append(run_case(case, params, tmp_dir))
+
+    print_results(run, history[-1] if history else None)
+
+    history.append(run)
+    with open(args.results, "w") as f:
+        json.dump(history, f, indent=2)
+
+    print("Stored the results - %s " % args.results)
@@ -0,0 +1,74 @@
+import os
+import sys
+import hashlib
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from systemrdl import RDLCompiler
+from peakrdl.pdf import PDFExporter
+
+from generate_rdl import generate_rdl
+
+this_dir = os.path.dirname(os.path.realpath(__file__))
+
+# The page templates load the logo relative to the examples directory
+os.chdir(os.path.join(this_dir, "../examples"))
+
+############################################################################
+# Stress test of concurrent exports
+#
+# The same design is exported once serially (reference) and then many
+# times concurrently from a thread pool, one exporter per export. All the
+# outputs must be byte identical to the reference.
+############################################################################
+def export_file(root, path: str) -> str:
+    """
+    Export the root into path, returns the md5 of the output file
+    """
+
+    exporter = PDFExporter()
+    exporter.export([root], path, progress_callback=lambda done, total: None)
+
+    with open(path, "rb") as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run concurrent exports and compare the outputs")
+    parser.add_argument("--exports", type=int, default=16, help="number of concurrent exports")
+    parser.add_argument("--threads", type=int, default=8, help="size of the thread pool")
+    parser.add_argument("--case", default="2:20:4:8:0.2",
+                        help="design as maps:regs:fields:array_size:gap_density")
+    args = parser.parse_args()
+
+    values = args.case.split(":")
+    if len(values) != 5:
+        parser.error("Not a valid case '%s'" % args.case)
+    maps, regs, fields, array_size = (int(x) for x in values[:4])
+    gap_density = float(values[4])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file = os.path.join(tmp_dir, "stress.rdl")
+        with open(input_file, "w") as f:
+            f.write(generate_rdl(maps, regs, fields, array_size, gap_density))
+
+        rdlc = RDLCompiler()
+        rdlc.compile_file(input_file)
+        root = rdlc.elaborate()
+
+        reference = export_file(root, os.path.join(tmp_dir, "reference.pdf"))
+
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            futures = [executor.submit(export_file, root, os.path.join(tmp_dir, "out_%d.pdf" % i))
+                       for i in range(args.exports)]
+            digests = [future.result() for future in futures]
+
+    mismatches = [i for i, digest in enumerate(digests) if digest != reference]
+
+    print("%d concurrent exports, %d thread(s): %d differ from the reference (%s)" %
+          (args.exports, args.threads, len(mismatches), reference))
+
+    if mismatches:
+        print("Different outputs: %s" % ", ".join("out_%d.pdf" % i for i in mismatches))
+        sys.exit(1)
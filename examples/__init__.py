@@ -1 +0,0 @@
-from .front_pg_later_pgs_info import myFirstPage, myLaterPages
@@ -5,6 +5,8 @@ from systemrdl.node import RootNode, Node, RegNode, AddrmapNode, RegfileNode
 from systemrdl.node import FieldNode, MemNode, AddressableNode
 from peakrdl.pdf import PDFExporter
 
+from front_pg_later_pgs_info import ExamplePageTemplate
+
 # Ignore this. Only needed for this example
 this_dir = os.path.dirname(os.path.realpath(__file__))
 sys.path.insert(0, os.path.join(this_dir, "../input_files"))
@@ -40,7 +42,8 @@ exporter = PDFExporter()
 dest_pdf_fl = "example_registers_spec.pdf"
 exporter.export(rdlc_elab_list, 
                 os.path.join(output_dir, dest_pdf_fl),
-                use_uppercase_inst_name=True)
+                use_uppercase_inst_name=True,
+                page_template=ExamplePageTemplate(revision="1.0"))
 
 print("Generated the output file - %s " %dest_pdf_fl)
 
@@ -51,14 +54,12 @@ print("Generated the output file - %s " %dest_pdf_fl)
 ## for file_f in input_files:
 ##     dest_pdf_list.append(file_f.replace(".rdl",".pdf"))
 ## 
-## # Separate output pdf file for each input rdl file
+## # Separate output pdf file for each input rdl file, rendered in a
+## # process pool (at most max_workers documents at the same time)
+## items = []
 ## for root_id,root in enumerate(rdlc_elab_list):
-##     # Input to exporter takes list, so create a list
-##     root_list = []
-##     root_list.append(root)
+##     items.append((root, os.path.join(output_dir, dest_pdf_list[root_id])))
 ## 
-##     exporter.export(root_list, 
-##                     os.path.join(output_dir, dest_pdf_list[root_id]),
-##                     use_uppercase_inst_name=True)
-##     print("Generated the output file - %s " %dest_pdf_list[root_id])
-
+## exporter.export_batch(items,
+##                       max_workers=4,
+##                       use_uppercase_inst_name=True)
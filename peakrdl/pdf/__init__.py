@@ -1,3 +1,5 @@
 from .__about__ import __version__
 
 from .exporter import PDFExporter
+from .instrumentation import Instrumentation
+from .page_template import PageTemplate
@@ -0,0 +1,205 @@
+import heapq
+
+from .regmap_model import AddrmapInfo, MemoryInfo, get_end_offset
+
+############################################################################
+# Address map analysis: holes, overlaps and alignment violations
+#
+# The registers, memories and nested address maps of an address map are
+# sorted once by their offset (get_intervals, also used for the reserved
+# rows of the registers list) and swept in address order, so each address
+# map is checked in O(n log n + overlaps):
+#   hole       - [start, end) not covered by any entry or nested address
+#                map (within the size of the address map)
+#   overlap    - [start, end) covered by two registers or memories
+#   misaligned - entry whose offset (or array stride) is not a multiple of
+#                its size (registers) or of its entry size (memories)
+#
+# The offsets of the issues are relative to the address map. Overlaps in
+# between the address maps of a root (including the overlaps of an entry
+# with the entries of a nested address map) are found from the absolute
+# ranges of the AddressIndex (check_addrmap_overlaps), so each overlap is
+# reported once.
+############################################################################
+
+class AddressIssue:
+    """
+    A hole, overlap or misaligned entry at [start, end)
+
+    names are the instance names of the entries involved
+    (none for a hole)
+    """
+    __slots__ = ('kind', 'start', 'end', 'names')
+
+    def __init__(self, kind: str, start: int, end: int, names: list):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.names = names
+
+    def as_dict(self) -> dict:
+        return {
+            'kind': self.kind,
+            'start': self.start,
+            'end': self.end,
+            'names': self.names,
+        }
+
+    def __repr__(self):
+        return "%s [0x%x, 0x%x) %s" % (self.kind, self.start, self.end, " ".join(self.names))
+
+
+class AddressCheck:
+    """
+    Issues of one address map (offsets relative to the address map)
+
+    summary holds the aggregates of the address map (bus width, register
+    count, extent, nonzero resets)
+    """
+    __slots__ = ('root_id', 'addrmap', 'base_address', 'address_width', 'issues',
+                 'summary')
+
+    def __init__(self, root_id: int, addrmap: str, base_address: int, address_width: int,
+                 issues: list, summary: dict = None):
+        self.root_id = root_id
+        self.addrmap = addrmap
+        self.base_address = base_address
+        self.address_width = address_width
+        self.issues = issues
+        self.summary = summary if summary is not None else {}
+
+    def get_issues(self, kind: str) -> list:
+        return [issue for issue in self.issues if issue.kind == kind]
+
+    def as_dict(self) -> dict:
+        return {
+            'root_id': self.root_id,
+            'addrmap': self.addrmap,
+            'base_address': self.base_address,
+            'summary': self.summary,
+            'holes': [issue.as_dict() for issue in self.get_issues("hole")],
+            'overlaps': [issue.as_dict() for issue in self.get_issues("overlap")],
+            'misaligned': [issue.as_dict() for issue in self.get_issues("misaligned")],
+        }
+
+
+def get_alignment(entry) -> int:
+    """
+    Returns the required alignment (in bytes) of a register or a memory
+    """
+
+    if isinstance(entry, MemoryInfo):
+        # Entry size, rounded up to a power of 2
+        entry_size = max((entry.width + 7) // 8, 1)
+        return 1 << (entry_size - 1).bit_length()
+
+    return entry.total_size
+
+
+def get_intervals(addrmap: AddrmapInfo) -> list:
+    """
+    Returns the [start, end) offsets of the registers, memories and nested
+    address maps, sorted by their start, as (start, end, entry_id, name, entry)
+
+    The registers keep their ids, the memories are numbered after them and
+    the nested address maps after the memories (their entry is None)
+    """
+
+    entries = addrmap.registers + addrmap.memories
+
+    intervals = []
+    for entry_id, entry in enumerate(entries):
+        intervals.append((entry.address_offset, get_end_offset(entry), entry_id,
+                          entry.inst_name, entry))
+
+    for submap_id, (inst_name, address_offset, size) in enumerate(addrmap.submaps, len(entries)):
+        intervals.append((address_offset, address_offset + size, submap_id, inst_name, None))
+
+    intervals.sort(key=lambda interval: interval[:3])
+
+    return intervals
+
+
+def iter_overlaps(intervals) -> tuple:
+    """
+    Yields the (start, end, first, second) overlaps of every pair of the
+    (start, end, item) intervals, sorted by their start
+
+    The intervals which still reach the current start are kept in a heap
+    by their end, so each interval is compared with all of them
+    """
+
+    active = []
+    for interval_id, (start, end, item) in enumerate(intervals):
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+
+        for active_end, active_id, active_item in sorted(active, key=lambda a: a[1]):
+            yield (start, min(end, active_end), active_item, item)
+
+        heapq.heappush(active, (end, interval_id, item))
+
+
+def check_addrmap(root_id: int, addrmap: AddrmapInfo) -> AddressCheck:
+    """
+    Returns the holes, overlaps and misaligned entries of the address map
+    """
+
+    issues = []
+
+    for entry in addrmap.registers + addrmap.memories:
+        alignment = get_alignment(entry)
+        if alignment and (entry.address_offset % alignment or
+                          (entry.array_stride is not None and entry.array_stride % alignment)):
+            issues.append(AddressIssue("misaligned", entry.address_offset,
+                                       get_end_offset(entry), [entry.inst_name]))
+
+    intervals = get_intervals(addrmap)
+
+    # Holes, the nested address maps cover their addresses
+    covered_end = 0
+    for start, end, entry_id, name, entry in intervals:
+        if start > covered_end:
+            issues.append(AddressIssue("hole", covered_end, start, []))
+        covered_end = max(covered_end, end)
+
+    if covered_end < addrmap.size:
+        issues.append(AddressIssue("hole", covered_end, addrmap.size, []))
+
+    # Overlaps of the registers and memories (the nested address maps are
+    # checked with their entries by check_addrmap_overlaps)
+    entries = [(start, end, name) for start, end, entry_id, name, entry in intervals
+               if entry is not None]
+    for start, end, first, second in iter_overlaps(entries):
+        issues.append(AddressIssue("overlap", start, end, [first, second]))
+
+    issues.sort(key=lambda issue: issue.start)
+
+    summary = {
+        'bus_width': addrmap.bus_width,
+        'register_count': addrmap.register_count,
+        'extent': addrmap.extent,
+        'nonzero_resets': addrmap.nonzero_resets,
+    }
+
+    return AddressCheck(root_id, addrmap.name, addrmap.base_address, addrmap.address_width,
+                        issues, summary)
+
+
+def check_addrmap_overlaps(ranges: list) -> list:
+    """
+    Returns the overlaps in between the address maps, from the absolute
+    ranges (AddressRange, sorted by their start) of a root
+
+    The names of the entries are prefixed with their address map
+    """
+
+    issues = []
+
+    for start, end, first, second in iter_overlaps((r.start, r.end, r) for r in ranges):
+        if first.addrmap != second.addrmap:
+            issues.append(AddressIssue("overlap", start, end,
+                                       ["%s.%s" % (first.addrmap, first.entry.inst_name),
+                                        "%s.%s" % (second.addrmap, second.entry.inst_name)]))
+
+    return issues
@@ -0,0 +1,162 @@
+import bisect
+
+from .regmap_model import AddrmapInfo, get_entry_size, get_end_offset
+
+############################################################################
+# Index of the absolute address ranges of the exported registers and
+# memories
+#
+# The absolute base of each address map is resolved once, top-down, by
+# the extraction walk (AddrmapInfo.base_address). The index adds the
+# registers and memories of each address map with their absolute
+# [start, end) range and answers address queries with a binary search:
+#
+#   exporter.export(roots, "out.pdf")
+#   entry = exporter.address_index.lookup(0x4000_1234)
+#   print(entry.addrmap, entry.entry.inst_name, entry.element)
+#
+# Each root is indexed separately (different designs share the same
+# addresses). A collapsed array is a single range which covers all the
+# elements, only the addresses inside an element are matched. The entries
+# of an address map array are added once per instance of the address map.
+############################################################################
+
+class AddressRange:
+    """
+    Absolute [start, end) range of a register or a memory
+
+    entry is the RegisterInfo or MemoryInfo, addrmap the name of its
+    address map and instance the index of the address map instance
+    (see AddrmapInfo.instance_bases)
+    """
+    __slots__ = ('start', 'end', 'root_id', 'addrmap', 'entry', 'element', 'instance')
+
+    def __init__(self, start: int, end: int, root_id: int, addrmap: str, entry,
+                 element: int = None, instance: int = 0):
+        self.start = start
+        self.end = end
+        self.root_id = root_id
+        self.addrmap = addrmap
+        self.entry = entry
+        self.instance = instance
+
+        # Index of the element matched by a lookup (arrays only)
+        self.element = element
+
+    def __repr__(self):
+        return "%s.%s [0x%x, 0x%x)" % (self.addrmap, self.entry.inst_name, self.start, self.end)
+
+
+class AddressIndex:
+
+    def __init__(self):
+        """
+        Constructor for the Address Index class
+        """
+
+        # Ranges of each root (key = root_id), sorted by their start on
+        # the first query after they were added
+        self.ranges_db = {}
+
+        # Sorted starts and the running maximum of the ends of each root
+        self.starts_db = {}
+        self.max_ends_db = {}
+
+    def clear(self):
+        self.ranges_db.clear()
+        self.starts_db.clear()
+        self.max_ends_db.clear()
+
+    def add_addrmap(self, root_id: int, addrmap: AddrmapInfo):
+        """
+        Adds the registers and the memories of the address map
+        """
+
+        ranges = self.ranges_db.setdefault(root_id, [])
+
+        for instance, base_address in enumerate(addrmap.instance_bases):
+            for entry in addrmap.registers + addrmap.memories:
+                ranges.append(AddressRange(base_address + entry.address_offset,
+                                           base_address + get_end_offset(entry),
+                                           root_id, addrmap.name, entry, None, instance))
+
+        # Sorted again by the next query
+        self.starts_db.pop(root_id, None)
+
+    def lookup(self, address: int, root_id: int = 0) -> AddressRange:
+        """
+        Returns the range of the register (or memory) which covers the
+        absolute address, None if there is none
+        """
+
+        ranges = self.get_sorted_ranges(root_id)
+        starts = self.starts_db[root_id]
+        max_ends = self.max_ends_db[root_id]
+
+        # Ranges starting at or before the address, the latest first.
+        # No earlier range reaches the address once the running maximum
+        # of the ends is below it
+        i = bisect.bisect_right(starts, address) - 1
+        while i >= 0 and max_ends[i] > address:
+            r = ranges[i]
+            element = self.get_element(r, address)
+            if element is not None:
+                if r.entry.array_dimensions is None:
+                    return r
+                return AddressRange(r.start, r.end, r.root_id, r.addrmap, r.entry, element,
+                                    r.instance)
+            i -= 1
+
+        return None
+
+    def query(self, start: int, end: int, root_id: int = 0) -> list:
+        """
+        Returns the ranges which overlap the absolute [start, end) range,
+        sorted by their start
+        """
+
+        ranges = self.get_sorted_ranges(root_id)
+
+        # The ranges before the first running maximum of the ends above
+        # start, and from the first start at or after end, do not overlap
+        first = bisect.bisect_right(self.max_ends_db[root_id], start)
+        stop = bisect.bisect_left(self.starts_db[root_id], end)
+
+        return [r for r in ranges[first:stop] if r.end > start]
+
+    def get_sorted_ranges(self, root_id: int) -> list:
+        ranges = self.ranges_db.get(root_id, [])
+
+        if root_id not in self.starts_db:
+            ranges.sort(key=lambda r: r.start)
+
+            max_ends = []
+            max_end = 0
+            for r in ranges:
+                max_end = max(max_end, r.end)
+                max_ends.append(max_end)
+
+            self.starts_db[root_id] = [r.start for r in ranges]
+            self.max_ends_db[root_id] = max_ends
+
+        return ranges
+
+    def get_element(self, address_range: AddressRange, address: int) -> int:
+        """
+        Returns the index of the array element which covers the address
+        (0 if the entry is not an array), None if the address is not covered
+        """
+
+        if not address_range.start <= address < address_range.end:
+            return None
+
+        entry = address_range.entry
+        if entry.array_dimensions is None:
+            return 0
+
+        element, offset = divmod(address - address_range.start, entry.array_stride)
+        if offset >= get_entry_size(entry):
+            # In between two elements
+            return None
+
+        return element
@@ -0,0 +1,71 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+############################################################################
+# Batch rendering of many documents (see PDFExporter.export_batch)
+#
+# The elaborated nodes can not be sent to other processes, so the address
+# maps of each document are extracted in the current process and the
+# documents are rendered from their jobs in a process pool. Each worker
+# process keeps one exporter for all the documents it renders, so the
+# style sheet, the page template (and its decoded logo) and the font
+# metrics are loaded once per worker.
+#
+# At most twice as many documents as workers are extracted ahead of the
+# rendering, so the memory use does not grow with the number of documents.
+############################################################################
+
+# Exporter of the worker process (see init_worker)
+worker_exporter = None
+
+def init_worker(options: dict):
+    """
+    Create the exporter of the worker process with the export options
+    """
+
+    global worker_exporter # pylint: disable=global-statement
+
+    # Importing here to avoid a circular import
+    from .exporter import PDFExporter # pylint: disable=import-outside-toplevel
+
+    worker_exporter = PDFExporter()
+    worker_exporter.set_export_options(dict(options))
+
+    # The progress is reported by the batch
+    worker_exporter.progress_callback = lambda done_roots, total_roots: None
+
+
+def render_document(jobs: list, path: str) -> str:
+    """
+    Render the jobs of one document (runs in a worker process)
+
+    Returns the output file
+    """
+
+    worker_exporter.render_document(jobs, path)
+    return path
+
+
+def render_batch(documents, max_workers: int, options: dict):
+    """
+    Render the (jobs, path) documents with at most max_workers worker
+    processes, the export options are the same for all the documents
+
+    Yields the output file of each document once it is written
+    (in the order they complete)
+    """
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker,
+                             initargs=(options,)) as executor:
+        pending = set()
+        for jobs, path in documents:
+            pending.add(executor.submit(render_document, jobs, path))
+
+            if len(pending) >= 2*max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
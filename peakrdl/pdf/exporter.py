@@ -1,22 +1,39 @@
 import sys
 import os
+import json
 import re
 import datetime
 import time
+import itertools
+import contextlib
+import cProfile
 
 from systemrdl.node import RootNode, Node, RegNode, AddrmapNode, RegfileNode
 from systemrdl.node import FieldNode, MemNode, AddressableNode
 from systemrdl.rdltypes import AccessType, OnReadType, OnWriteType
-from systemrdl import RDLWalker
-
-from .pdf_creator import PDFCreator
-from .pre_export_listener import PreExportListener
+from systemrdl import RDLWalker, RDLCompiler
+
+from .extract_listener import ExtractListener
+from .address_index import AddressIndex
+from .address_check import check_addrmap, check_addrmap_overlaps, get_intervals
+from .regmap_model import AddrmapInfo, RegisterInfo, FieldInfo, MemoryInfo
+from .regmap_model import MODEL_VERSION, get_digest
+from .property_cache import PropertyCache
+from .fragment_cache import FragmentCache
+from .formatter import get_formatter
+from .page_template import PageTemplate
+from .model_cache import ModelCache
+from .instrumentation import NO_STAGE
+from .__about__ import __version__
 
 class PDFExporter:
     
     def __init__(self, **kwargs):
         """
         Constructor for the PDF Exporter class
+
+        The exporter holds the state of the export in progress, concurrent
+        exports (threads) need one exporter each
         """
 
         # Check for stray kwargs
@@ -28,43 +45,109 @@ class PDFExporter:
         # Top-level node
         self.top = None
 
-        # Dictionary of group-like nodes (addrmap, regfile) and their bus
-        # widths.
-        # key = node path
-        # value = max accesswidth/memwidth used in node's descendants
-        self.bus_width_db = {}
-
         # Dictionary of root-level type definitions
         # key = definition type name
         # value = representative object
-        #   components, this is the original_def (which can be None in some cases)
+        #   registers, this is the list of (fields digest, section title) of
+        #   the rendered registers with a field table (see dedup_fields)
         self.namespace_db = {}
 
         # Used for making the instance name(s) in uppercase or lowercase
         self.use_uppercase_inst_name = True
 
+        # Memoized property/UDP lookups (cleared on each export)
+        self.property_cache = PropertyCache()
+
+        # Render a register array once instead of once per element
+        self.collapse_arrays = False
+
+        # Reference the field table of an already rendered register
+        # with the same definition and fields instead of repeating it
+        self.dedup_fields = False
+
+        # Dictionary of the extracted registers (cleared on each export)
+        # key = register instance (shared by the elements of an array)
+        # value = RegisterInfo
+        self.register_db = {}
+
+        # Used for reporting the export progress
+        # Called as progress_callback(done_roots, total_roots)
+        self.progress_callback = None
+
+        # TOC mode ("multipass" or "single")
+        self.toc_mode = "multipass"
+
+        # Duration (in seconds) of each layout pass of the last export
+        self.build_pass_times = []
+
+        # Number of worker processes used for rendering
+        self.workers = 1
+
+        # Directory and size (in bytes) of the rendered fragments cache
+        self.cache_dir = None
+        self.cache_size = 512*1024*1024
+
+        # Lay out the pages while the address maps are traversed
+        self.streaming = False
+
+        # Page decorations of the document. The default template is kept
+        # across the exports, so its logo is decoded only once
+        self.default_page_template = PageTemplate()
+        self.page_template = self.default_page_template
+
+        # Style sheet of the documents, created by the first document
+        # and shared by the later ones
+        self.stylesheet = None
+
+        # Collects the time/memory of the export stages (see Instrumentation)
+        self.instrumentation = None
+
+        # Output file of the cProfile statistics of the export
+        self.profile_path = None
+
+        # Whether the model of the last export_files was read from the cache
+        self.model_from_cache = False
+
+        # Names of the address maps rendered by the last export
+        # (the others were reused from the cache)
+        self.rebuilt_maps = []
+
         # Used for address width - Default 32bits
         self.address_width = 32 
+        self.address_formatter = get_formatter(self.address_width)
 
         # Used for absoulte address calculations
         self.base_address = 0x0
 
+        # Absolute address ranges of the registers and memories
+        # of the last export (see AddressIndex), empty after a streaming
+        # export without address_appendix and address_report
+        self.address_index = AddressIndex()
+
+        # Holes, overlaps and misaligned entries of each address map
+        # of the last export (AddressCheck) and the overlaps in between
+        # the address maps (key = root_id, value = list of AddressIssue)
+        self.address_checks = []
+        self.address_overlaps = {}
+
+        # Add the address check appendix to the document
+        self.address_appendix = False
+
+        # Output file of the address check summary (JSON)
+        self.address_report = None
+
         # Get the today's date (mm-dd-yyyy)
         self.today_date = datetime.date.today().strftime('%m-%d-%Y')
 
         # Get the current time (hh:mm:ss)
         self.current_time = time.strftime('%H:%M:%S') 
 
-        # Create the global variable for pdf creation
-        global pdf_create
+    def set_address_width(self, addrmap: AddrmapInfo):
+        self.address_width = addrmap.address_width
+        self.address_formatter = get_formatter(self.address_width)
 
-    def set_address_width(self, node: Node):
-        self.address_width = self.get_address_width(node)
-
-    def set_base_address(self, node:Node):
-        # Get the property value
-        amap = node.owning_addrmap
-        self.base_address = amap.get_property("base_address_p", default=0x0);
+    def set_base_address(self, addrmap: AddrmapInfo):
+        self.base_address = addrmap.base_address
 
     def export(self, node_list: list, path: str, **kwargs):
         """
@@ -83,140 +166,962 @@ class PDFExporter:
             If True (Default), all the instance names will be in uppercase
 
             if False, all the instance names will be in lowercase
+
+        progress_callback: callable
+            Called as progress_callback(done_roots, total_roots) after each
+            root in node_list has been processed.
+
+            If None (Default), the progress is printed as a percentage
+
+        toc_mode: str
+            If "multipass" (Default), the document is laid out repeatedly
+            until the TOC page numbers are stable.
+
+            If "single", the TOC has a fixed layout and the document is laid
+            out only once. The page numbers are filled in after the layout.
+
+        workers: int
+            Number of worker processes used for rendering the address maps.
+
+            If 1 (Default), the document is rendered in the current process.
+            Values above 1 render each address map into its own PDF fragment
+            in a process pool and merge the fragments (requires pypdf).
+
+        cache_dir: str
+            Directory for caching the rendered address maps. Address maps
+            whose content did not change since a previous export are not
+            rendered again (requires pypdf).
+
+            If None (Default), nothing is cached
+
+        cache_size: int
+            Maximum size of the cache directory in bytes (Default 512MB).
+            The least recently used entries are removed above it.
+
+        streaming: bool
+            If True, the pages are laid out while the address maps are
+            traversed, so the memory use does not grow with the number of
+            registers. The TOC is placed at the end of the document and
+            toc_mode is not used. Can not be combined with workers or
+            cache_dir. The address index and the address check are only
+            built with address_appendix or address_report.
+
+            If False (Default), the whole document is laid out at the end
+
+        collapse_arrays: bool
+            If True, a register array is rendered once (one row in the
+            registers list and one register section) with its address
+            expression, e.g. 'h10 + i0*'h4
+
+            If False (Default), each element of the array is rendered
+
+        dedup_fields: bool
+            If True, the fields table of a register is replaced by a link to
+            the first register with the same reg definition and the same
+            fields. With workers or cache_dir, only the registers of the
+            same address map are linked.
+
+            If False (Default), every register has its fields table
+
+        instrumentation: Instrumentation
+            Collects the time (and memory) of the export stages of each root
+            and address map: extract, flowables, layout (per address map),
+            layout pass (per TOC pass) and write.
+
+            If None (Default), the stages are not recorded
+
+        profile_path: str
+            Output file for the cProfile statistics of the export
+            (pstats format, e.g. for snakeviz or flameprof)
+
+            If None (Default), the export is not profiled
+
+        page_template: PageTemplate
+            Decorations of the first page and of the later pages (logo,
+            header, footer and page number). The static part of each page
+            layout is drawn once per document and reused by every page.
+
+            If None (Default), the example template is used (with the
+            example_logo.png logo of the current directory)
+        """
+
+        self.set_export_options(kwargs)
+        self.reset_caches()
+
+        with self.profile():
+            # Call the method for initiating the document creation
+            self.generate_output_pdf(node_list, path)
+
+    #####################################################################
+    # Clear the caches of the previous export (or document), the
+    # property values may have changed since
+    #####################################################################
+    def reset_caches(self):
+        self.property_cache.clear()
+        self.register_db.clear()
+        self.namespace_db.clear()
+
+    #####################################################################
+    # Compile, elaborate and export the input .rdl files
+    #####################################################################
+    def export_files(self, input_files: list, path: str, **kwargs):
+        """
+        Compile and elaborate each input file and export them into one
+        document (same as export on the elaborated nodes)
+
+        Parameters
+        ----------
+        input_files: List of str
+            Input .rdl files
+
+        path: str
+            Output file.
+
+        incl_search_paths: List of str
+            Search paths for the `include files
+
+        model_cache_dir: str
+            Directory for caching the extracted model of the input files.
+            If the input files (and all the files they include) did not
+            change since a previous export, the model is read from the cache
+            and the files are not compiled and elaborated. The least
+            recently used models are removed above cache_size.
+
+            If None (Default), nothing is cached
+
+        All the other parameters are the same as for export.
+        """
+
+        incl_search_paths = kwargs.pop("incl_search_paths", None) or []
+        model_cache_dir = kwargs.pop("model_cache_dir", None)
+
+        self.set_export_options(kwargs)
+        self.reset_caches()
+
+        self.model_from_cache = False
+
+        with self.profile():
+            self.generate_output_pdf_files(input_files, path, incl_search_paths, model_cache_dir)
+
+    #####################################################################
+    # Export many documents, each from its own nodes
+    #####################################################################
+    def export_batch(self, items: list, **kwargs):
+        """
+        Export each (node_list, path) item into its own document
+
+        The address maps of each document are extracted in the current
+        process and the documents are rendered in a process pool. The
+        style sheet, the page template and the font metrics are loaded once
+        per worker process and shared by the documents it renders.
+
+        Parameters
+        ----------
+        items: List of (node_list, path)
+            Nodes to export (a systemrdl.Node or a list of them, as for
+            export) and the output file of each document
+
+        max_workers: int
+            Maximum number of documents rendered at the same time.
+
+            If 1, the documents are rendered one after the other in the
+            current process.
+            If None (Default), the number of CPUs is used
+
+        progress_callback: callable
+            Called as progress_callback(done_documents, total_documents)
+            after each document has been written.
+
+            If None (Default), the progress and the output file are printed
+
+        All the other parameters are the same as for export, except
+        workers, cache_dir and address_report. instrumentation and
+        profile_path only cover the extraction (and the rendering
+        if max_workers is 1).
         """
 
+        max_workers = kwargs.pop("max_workers", None)
+        batch_progress_callback = kwargs.pop("progress_callback", None)
+
+        # Options of the worker processes
+        options = {key: value for key, value in kwargs.items()
+                   if key not in ("instrumentation", "profile_path")}
+
+        self.set_export_options(kwargs)
+
+        if self.workers > 1 or self.cache_dir is not None or self.address_report is not None:
+            raise ValueError("workers, cache_dir and address_report can not be used with export_batch")
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        # The progress is reported per document
+        self.progress_callback = lambda done_roots, total_roots: None
+
+        items = list(items)
+
+        with self.profile():
+            documents = self.iter_documents(items)
+
+            if max_workers == 1:
+                written = self.render_documents(documents)
+            else:
+                # Importing here, the process pool is only needed by the batch
+                from .batch import render_batch # pylint: disable=import-outside-toplevel
+
+                written = render_batch(documents, max_workers, options)
+
+            for done, path in enumerate(written, 1):
+                if batch_progress_callback is not None:
+                    batch_progress_callback(done, len(items))
+                else:
+                    print("[%d%%] Generated the output file - %s" %
+                          (float(done)*100/len(items), path))
+
+    #####################################################################
+    # Extract the jobs of each (node_list, path) item of a batch,
+    # one document at a time
+    #####################################################################
+    def iter_documents(self, items: list):
+        for node_list, path in items:
+            if isinstance(node_list, Node):
+                node_list = [node_list]
+
+            self.reset_caches()
+
+            yield (list(self.iter_jobs(node_list)), path)
+
+    #####################################################################
+    # Render the documents of a batch in the current process
+    #####################################################################
+    def render_documents(self, documents):
+        for jobs, path in documents:
+            self.render_document(jobs, path)
+            yield path
+
+    #####################################################################
+    # Render the jobs of one document of a batch
+    #####################################################################
+    def render_document(self, jobs: list, path: str):
+        # The field tables are only linked within the document
+        self.namespace_db.clear()
+
+        self.render_jobs(jobs, path)
+
+    #####################################################################
+    # Generate the output pdf file from the input .rdl files
+    # (from the cached model if possible)
+    #####################################################################
+    def generate_output_pdf_files(self, input_files: list, path: str,
+                                  incl_search_paths: list, model_cache_dir: str):
+
+        if model_cache_dir is not None:
+            model_cache = ModelCache(model_cache_dir, self.cache_size)
+
+            # Options which change the extracted model
+            options = (__version__, MODEL_VERSION, self.use_uppercase_inst_name,
+                       self.collapse_arrays)
+            digest = model_cache.get_digest(input_files, incl_search_paths, options)
+
+            jobs = model_cache.get(digest)
+            if jobs is not None:
+                self.model_from_cache = True
+                self.render_jobs(jobs, path)
+                return
+
+        with self.stage("compile"):
+            root_list = self.compile_files(input_files, incl_search_paths)
+
+        if model_cache_dir is not None:
+            jobs = list(self.iter_jobs(root_list))
+            model_cache.put(digest, jobs)
+            self.render_jobs(jobs, path)
+        else:
+            self.render_jobs(self.iter_jobs(root_list), path)
+
+    #####################################################################
+    # Compile and elaborate the input .rdl files
+    #####################################################################
+    def compile_files(self, input_files: list, incl_search_paths: list) -> list:
+        rdlc = RDLCompiler()
+
+        # List for storing the elaborated ouput of each .rdl file
+        root_list = []
+
+        for input_file in input_files:
+            rdlc.compile_file(input_file, incl_search_paths=incl_search_paths)
+            root_list.append(rdlc.elaborate())
+
+        return root_list
+
+    #####################################################################
+    # Set the export options (kwargs of export)
+    #####################################################################
+    def set_export_options(self, kwargs: dict):
         self.use_uppercase_inst_name = kwargs.pop("use_uppercase_inst_name", True)
+        self.progress_callback = kwargs.pop("progress_callback", None)
+        self.toc_mode = kwargs.pop("toc_mode", "multipass")
+        self.workers = kwargs.pop("workers", 1)
+        self.cache_dir = kwargs.pop("cache_dir", None)
+        self.cache_size = kwargs.pop("cache_size", 512*1024*1024)
+        self.streaming = kwargs.pop("streaming", False)
+        self.collapse_arrays = kwargs.pop("collapse_arrays", False)
+        self.dedup_fields = kwargs.pop("dedup_fields", False)
+        self.instrumentation = kwargs.pop("instrumentation", None)
+        self.profile_path = kwargs.pop("profile_path", None)
+        self.page_template = kwargs.pop("page_template", None)
+        self.address_appendix = kwargs.pop("address_appendix", False)
+        self.address_report = kwargs.pop("address_report", None)
+
+        if self.page_template is None:
+            self.page_template = self.default_page_template
 
         # Check for stray kwargs
         if kwargs:
             raise TypeError("got an unexpected keyword argument '%s'" % list(kwargs.keys())[0])
 
-        # Call the method for initiating the document creation
-        self.generate_output_pdf(node_list, path)
+        if self.streaming and (self.workers > 1 or self.cache_dir is not None):
+            raise ValueError("streaming can not be combined with workers or cache_dir")
+
+        if self.address_appendix and (self.workers > 1 or self.cache_dir is not None):
+            raise ValueError("address_appendix can not be combined with workers or cache_dir")
+
+    #####################################################################
+    # Instrumentation of a stage (context manager)
+    #####################################################################
+    def stage(self, name: str, root_id: int = None, addrmap: str = None):
+        if self.instrumentation is None:
+            return NO_STAGE
+
+        return self.instrumentation.stage(name, root_id, addrmap)
+
+    #####################################################################
+    # Profile the export with cProfile if a profile_path is set
+    # (context manager)
+    #####################################################################
+    @contextlib.contextmanager
+    def profile(self):
+        if self.profile_path is None:
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(self.profile_path)
 
     #####################################################################
     # Generate the output pdf files
     #####################################################################
     def generate_output_pdf(self, root_list: list, path: str):
 
-        # Create the object
-        self.pdf_create = PDFCreator(path)
-
         # Go through multiple input files 
         # root_list is elaborated output of input .rdl file(s)
+        self.render_jobs(self.iter_jobs(root_list), path)
+
+    #####################################################################
+    # Extract the address maps (in document order) as the rendering
+    # jobs (root_id, AddrmapInfo), with a single walk per root
+    # (see ExtractListener)
+    #####################################################################
+    def iter_jobs(self, root_list: list):
+        walker = RDLWalker(unroll=False)
+
         for root_id, root in enumerate(root_list):
-            for node in root.descendants(in_post_order=True):
+            listener = ExtractListener(self, root_id)
+            walker.walk(root, listener)
+            yield from listener.jobs
+
+            self.report_progress(root_id+1, len(root_list))
 
-                # Traverse all the address maps
-                if isinstance(node, AddrmapNode):
-                    self.create_regmap_list(node, root_id)
-                    self.create_regmap_registers_info(node, root_id)
+    #####################################################################
+    # Render the jobs (root_id, AddrmapInfo) into the output pdf file
+    #####################################################################
+    def render_jobs(self, jobs, path: str):
+
+        self.rebuilt_maps = []
+        self.build_pass_times = []
+
+        # Index and check the address maps while they are rendered. In
+        # streaming mode, only if they are reported (the index holds every
+        # register and memory of the document)
+        self.address_index.clear()
+        self.address_checks = []
+        self.address_overlaps = {}
+        if not self.streaming or self.address_appendix or self.address_report is not None:
+            jobs = self.index_jobs(jobs)
+
+        if self.workers > 1 or self.cache_dir is not None:
+            self.generate_output_pdf_fragments(list(jobs), path)
+        elif self.streaming:
+            self.generate_output_pdf_stream(jobs, path)
+        else:
+            self.generate_output_pdf_serial(jobs, path)
 
-            # Dump all the data into the pdf file 
-            self.pdf_create.build_document()
-            print("[%d%%]" % (float(root_id+1)*100/len(root_list)))
+        if self.address_report is not None:
+            with open(self.address_report, "w") as f:
+                json.dump(self.get_address_report(), f, indent=2)
+
+    #####################################################################
+    # Generate the output pdf file in the current process, laid out
+    # once all the address maps have been added
+    #####################################################################
+    def generate_output_pdf_serial(self, jobs, path: str):
+
+        # Create the object
+        self.pdf_create = self.create_pdf_creator(path, toc_mode=self.toc_mode)
+
+        # Address map of each section title (for the instrumentation)
+        sections = {}
+
+        for root_id, addrmap in jobs:
+            with self.stage("flowables", root_id, addrmap.name):
+                self.create_regmap_list(addrmap, root_id)
+                self.create_regmap_registers_info(addrmap, root_id)
+                self.create_regmap_memories_info(addrmap, root_id)
+            sections["%s %s" % ((root_id+1),addrmap.name)] = (root_id, addrmap.name)
+
+        if self.address_appendix:
+            self.create_address_appendix()
+
+        # Dump all the data into the pdf file (only once for all the roots)
+        self.pdf_create.build_document()
+        self.build_pass_times = self.pdf_create.get_pass_times()
+        self.add_build_stages(sections)
+
+    #####################################################################
+    # Add the address maps of the jobs to the address index and check
+    # them. The overlaps in between the address maps are checked once
+    # all the jobs have been taken
+    #####################################################################
+    def index_jobs(self, jobs):
+        for root_id, addrmap in jobs:
+            with self.stage("address check", root_id, addrmap.name):
+                self.address_index.add_addrmap(root_id, addrmap)
+                self.address_checks.append(check_addrmap(root_id, addrmap))
+            yield (root_id, addrmap)
+
+        with self.stage("address check"):
+            for root_id in sorted(self.address_index.ranges_db):
+                ranges = self.address_index.get_sorted_ranges(root_id)
+                self.address_overlaps[root_id] = check_addrmap_overlaps(ranges)
+
+    #####################################################################
+    # Returns the address check summary of the last export
+    # (JSON serializable)
+    #####################################################################
+    def get_address_report(self) -> dict:
+        overlaps = []
+        for root_id, issues in self.address_overlaps.items():
+            for issue in issues:
+                overlap = {'root_id': root_id}
+                overlap.update(issue.as_dict())
+                overlaps.append(overlap)
+
+        return {
+            'addrmaps': [check.as_dict() for check in self.address_checks],
+            'overlaps': overlaps,
+        }
+
+    #####################################################################
+    # Create the address check appendix: the issues of each address map
+    # and the overlaps in between the address maps
+    #####################################################################
+    def create_address_appendix(self):
+        self.pdf_create.create_appendix_info("Appendix: Address Check")
+
+        for check in self.address_checks:
+            formatter = get_formatter(check.address_width)
+            title = "%s %s" % ((check.root_id+1), check.addrmap)
+            self.pdf_create.create_address_check_info(title, self.get_issue_rows(check.issues, formatter))
+
+        # The overlaps in between the address maps are formatted with the
+        # widest address width of the address maps of the root
+        address_widths = {}
+        for check in self.address_checks:
+            address_widths[check.root_id] = max(check.address_width,
+                                                address_widths.get(check.root_id, 0))
+
+        for root_id, issues in self.address_overlaps.items():
+            if issues:
+                formatter = get_formatter(address_widths[root_id])
+                title = "%s Overlaps in between the address maps" % (root_id+1)
+                self.pdf_create.create_address_check_info(title, self.get_issue_rows(issues, formatter))
+
+        self.pdf_create.dump_appendix_info()
+
+    def get_issue_rows(self, issues: list, formatter) -> list:
+        rows = []
+        for issue in issues:
+            issue_strg = {}
+            issue_strg['Kind']    = issue.kind
+            issue_strg['Range']   = "%s till %s" % (formatter.format(issue.start), formatter.format(issue.end-1))
+            issue_strg['Entries'] = ", ".join(issue.names) if issue.names else "-"
+            rows.append(issue_strg)
+        return rows
+
+    #####################################################################
+    # Create the PDF creator of the document
+    #
+    # reportlab is imported on the first call,
+    # so importing peakrdl.pdf stays cheap
+    #####################################################################
+    def create_pdf_creator(self, path: str, **kwargs):
+        from .pdf_creator import PDFCreator # pylint: disable=import-outside-toplevel
+
+        pdf_create = PDFCreator(path, page_template=self.page_template,
+                                stylesheet=self.stylesheet, **kwargs)
+        self.stylesheet = pdf_create.styleSheet
+
+        return pdf_create
+
+    #####################################################################
+    # Add the layout and write stages of the last build
+    # to the instrumentation
+    #####################################################################
+    def add_build_stages(self, sections: dict):
+        if self.instrumentation is None:
+            return
+
+        pass_memory = self.pdf_create.get_pass_memory()
+        for pass_id, pass_time in enumerate(self.build_pass_times):
+            self.instrumentation.add("layout pass %d" % (pass_id+1), pass_time,
+                                     memory=pass_memory[pass_id])
+
+        section_memory = self.pdf_create.get_section_memory()
+        for title, section_time in self.pdf_create.get_section_times().items():
+            if title in sections:
+                root_id, name = sections[title]
+                self.instrumentation.add("layout", section_time, root_id, name,
+                                         section_memory.get(title))
+            else:
+                # First page and TOC
+                self.instrumentation.add("layout", section_time,
+                                         memory=section_memory.get(title))
+
+        self.instrumentation.add("write", self.pdf_create.get_write_time(),
+                                 memory=self.pdf_create.get_write_memory())
+
+    #####################################################################
+    # Generate the output pdf file while the address maps are traversed
+    # (the flowables are laid out and released register by register)
+    #####################################################################
+    def generate_output_pdf_stream(self, jobs, path: str):
+
+        # Address map of each section title (for the instrumentation)
+        sections = {}
+
+        self.pdf_create = self.create_pdf_creator(path, streaming=True)
+        self.pdf_create.build_document_stream(self.stream_registers(jobs, sections))
+        self.build_pass_times = self.pdf_create.get_pass_times()
+        self.add_build_stages(sections)
+
+    def stream_registers(self, jobs, sections: dict):
+        # Only one address map at a time is extracted
+        for root_id, addrmap in jobs:
+            sections["%s %s" % ((root_id+1),addrmap.name)] = (root_id, addrmap.name)
+
+            for reg in self.iter_regmap_list(addrmap, root_id):
+                yield reg
+
+            for reg_id, reg in enumerate(addrmap.registers):
+                self.create_regmap_register_info(reg, reg_id, root_id)
+                yield reg
+
+            for mem_id, mem in enumerate(addrmap.memories, len(addrmap.registers)):
+                self.create_regmap_memory_info(mem, mem_id, root_id)
+                yield mem
+
+        if self.address_appendix:
+            self.create_address_appendix()
+            yield None
+
+    #####################################################################
+    # Generate the output pdf file from separately rendered
+    # address maps (multiple worker processes and/or cache)
+    #####################################################################
+    def generate_output_pdf_fragments(self, jobs: list, path: str):
+
+        if self.cache_dir is not None:
+            cache = FragmentCache(self.cache_dir, self.cache_size)
+        else:
+            cache = None
+
+        # Importing here, reportlab is only loaded by the first export
+        from .parallel import build_from_fragments # pylint: disable=import-outside-toplevel
+
+        with self.stage("fragments"):
+            rendered = build_from_fragments(jobs, path, self.workers, cache, self.dedup_fields,
+                                            self.page_template)
+
+        self.rebuilt_maps = [jobs[job_id][1].name for job_id in rendered]
+
+    #####################################################################
+    # Report the progress of the export
+    #####################################################################
+    def report_progress(self, done_roots: int, total_roots: int):
+        if self.progress_callback is not None:
+            self.progress_callback(done_roots, total_roots)
+        else:
+            print("[%d%%]" % (float(done_roots)*100/total_roots))
+
+    #####################################################################
+    # Create the address map data from its extracted registers, memories,
+    # nested address maps and the absolute bases of its instances
+    #####################################################################
+    def extract_addrmap(self, node: AddrmapNode, registers: list, memories: list,
+                        submaps: list, instance_bases: list, bus_width: int) -> AddrmapInfo:
+        return AddrmapInfo(self.get_name(node),
+                           self.get_desc(node),
+                           instance_bases[0],
+                           node.size,
+                           self.get_address_width(node),
+                           registers,
+                           memories,
+                           submaps,
+                           instance_bases,
+                           self.get_bus_width(bus_width))
+
+    #####################################################################
+    # Extract the register data (and its reset value), computed only
+    # once per register instance. For arrays, the data of the first
+    # element is returned
+    #####################################################################
+    def extract_register(self, reg: RegNode) -> RegisterInfo:
+        reg_info = self.register_db.get(reg.inst)
+
+        if reg_info is not None:
+            return reg_info
+
+        fields = []
+        reg_reset = 0
+
+        for field in reg.fields():
+            field_reset = field.get_property('reset', default=0)
+
+            # Concatenate the value of the individual fields
+            # to form the register value
+            reg_reset |= field_reset << field.lsb
+
+            fields.append(FieldInfo(self.get_inst_name(field),
+                                    self.get_name(field),
+                                    self.get_desc(field),
+                                    field.msb,
+                                    field.lsb,
+                                    field.width,
+                                    field_reset,
+                                    self.get_field_access(field)))
+
+        # Reverse the fields order - MSB first
+        fields.reverse()
+
+        reg_info = RegisterInfo(self.get_inst_name(reg),
+                                self.get_name(reg),
+                                self.get_desc(reg),
+                                reg.raw_address_offset,
+                                reg.size,
+                                reg.get_property('regwidth'),
+                                reg_reset,
+                                self.get_reg_access(reg),
+                                fields,
+                                type_name=self.get_type_name(reg))
+
+        self.register_db[reg.inst] = reg_info
+        return reg_info
+
+    #####################################################################
+    # Place the register in its address map: the register data with the
+    # hierarchical prefix (path of the enclosing regfiles) and the offset
+    # of the enclosing regfile. Returns the entries of the registers list
+    #####################################################################
+    def place_register(self, reg: RegNode, reg_info: RegisterInfo, prefix: str = "",
+                       offset: int = 0) -> list:
+        if reg.is_array and self.collapse_arrays:
+            return [self.collapse_register_array(reg, reg_info, prefix, offset)]
+        elif reg.is_array:
+            return self.expand_register_array(reg, reg_info, prefix, offset)
+        elif prefix:
+            return [self.copy_register(reg_info, prefix + reg_info.inst_name,
+                                       offset + reg_info.address_offset)]
+        else:
+            return [reg_info]
+
+    #####################################################################
+    # Expand a register array into its elements
+    #
+    # The elements share the data (and the fields) of the register,
+    # only the index and the address offset are computed per element
+    #####################################################################
+    def expand_register_array(self, reg: RegNode, reg_info: RegisterInfo, prefix: str = "",
+                              offset: int = 0) -> list:
+        elements = []
+
+        for suffix, element_offset in self.iter_array_elements(reg):
+            elements.append(self.copy_register(reg_info,
+                                               prefix + reg_info.inst_name + suffix,
+                                               offset + element_offset))
+
+        return elements
+
+    #####################################################################
+    # Collapse a register array into a single entry, which is rendered
+    # once for all the elements
+    #####################################################################
+    def collapse_register_array(self, reg: RegNode, reg_info: RegisterInfo, prefix: str = "",
+                                offset: int = 0) -> RegisterInfo:
+        suffix = "".join("[%d]" % dim for dim in reg.array_dimensions)
+
+        return self.copy_register(reg_info,
+                                  prefix + reg_info.inst_name + suffix,
+                                  offset + reg_info.address_offset,
+                                  reg.array_dimensions,
+                                  reg.array_stride)
+
+    #####################################################################
+    # Copy of the register data with another name and address offset
+    # (the fields are shared)
+    #####################################################################
+    def copy_register(self, reg_info: RegisterInfo, inst_name: str, address_offset: int,
+                      array_dimensions: list = None, array_stride: int = None) -> RegisterInfo:
+        return RegisterInfo(inst_name,
+                            reg_info.name,
+                            reg_info.desc,
+                            address_offset,
+                            reg_info.total_size,
+                            reg_info.width,
+                            reg_info.reset,
+                            reg_info.access,
+                            reg_info.fields,
+                            array_dimensions,
+                            array_stride,
+                            reg_info.type_name)
+
+    #####################################################################
+    # Iterate over the elements of an addressable node as
+    # (index suffix, address offset), e.g. ("[1][0]", 0x18)
+    #
+    # The elements are laid out in row-major order, array_stride apart
+    # (a single element with an empty suffix if the node is not an array)
+    #####################################################################
+    def iter_array_elements(self, node: AddressableNode):
+        if not node.is_array:
+            yield ("", node.raw_address_offset)
+            return
+
+        indexes = itertools.product(*[range(dim) for dim in node.array_dimensions])
+
+        for element_id, index in enumerate(indexes):
+            suffix = "".join("[%d]" % i for i in index)
+            yield (suffix, node.raw_address_offset + element_id*node.array_stride)
+
+    #####################################################################
+    # Extract the memory data and its virtual registers
+    #
+    # A memory is summarized, nothing is extracted per entry: virtual
+    # register arrays and memory arrays are collapsed into one entry
+    #####################################################################
+    def extract_memory(self, mem: MemNode) -> MemoryInfo:
+        virtual_registers = []
+
+        for reg in mem.registers():
+            reg_info = self.extract_register(reg)
+
+            if reg.is_array:
+                virtual_registers.append(self.collapse_register_array(reg, reg_info))
+            else:
+                virtual_registers.append(reg_info)
+
+        return MemoryInfo(self.get_inst_name(mem),
+                          self.get_name(mem),
+                          self.get_desc(mem),
+                          mem.raw_address_offset,
+                          mem.size,
+                          mem.get_property('mementries'),
+                          mem.get_property('memwidth'),
+                          self.get_mem_access(mem),
+                          virtual_registers,
+                          mem.array_dimensions if mem.is_array else None,
+                          mem.array_stride if mem.is_array else None)
 
     #####################################################################
     # Create the regmap list for all regiters
     #####################################################################
-    def create_regmap_list(self, node: AddrmapNode, root_id: int): 
+    def create_regmap_list(self, addrmap: AddrmapInfo, root_id: int): 
+        for reg in self.iter_regmap_list(addrmap, root_id):
+            pass
+
+    #####################################################################
+    # Create the regmap list, one register at a time
+    # (yields each register after its row has been added)
+    #####################################################################
+    def iter_regmap_list(self, addrmap: AddrmapInfo, root_id: int):
         addrmap_strg = {}
         # set the required variable 
-        self.set_address_width(node)
-        self.set_base_address(node)
+        self.set_address_width(addrmap)
+        self.set_base_address(addrmap)
 
-        addrmap_strg['Name'] = "%s %s" % ((root_id+1),self.get_name(node))
-        addrmap_strg['Desc'] = self.get_desc(node)
-        addrmap_strg['Base_address'] = self.get_base_address(node)
-        addrmap_strg['Size'] = self.get_addrmap_size(node)
+        addrmap_strg['Name'] = "%s %s" % ((root_id+1),addrmap.name)
+        addrmap_strg['Desc'] = addrmap.desc
+        addrmap_strg['Base_address'] = self.format_address(addrmap.base_address)
+        addrmap_strg['Size'] = self.get_addrmap_size(addrmap)
         self.pdf_create.create_addrmap_info(addrmap_strg)
 
-        # Create a list of all registers for the map
-        for reg_id, reg in enumerate(node.registers()):
+        # Reserved space is the interval in between the entries (and the
+        # nested address maps, which are rendered separately), the same
+        # intervals as for the address check
+        covered_end = 0
+        slot_size = None
+
+        # Offsets of all the registers, formatted as one column
+        offsets = self.address_formatter.format_all([reg.address_offset for reg in addrmap.registers])
+
+        # Create a list of all registers (and memories) for the map
+        for start, end, entry_id, name, entry in get_intervals(addrmap):
             addrmap_reg_list_strg = {}
-            
-            # Reserved addresses at the start of the address map
-            if reg_id == 0 and reg.address_offset != 0:
-                offset_range = "%s till %s" % ((self.format_address(0)),self.format_address(reg.address_offset-1))
-                addrmap_reg_list_strg['Offset']     = offset_range 
-                addrmap_reg_list_strg['Identifier'] = "-" 
-                addrmap_reg_list_strg['Name']       = "-"
-                self.pdf_create.create_reg_list_info(addrmap_reg_list_strg, 1)
 
-            # Reserved addresses in between the address map - for single space
-            elif (reg_id != 0) and (reg_previous.address_offset + 2*reg_previous.total_size) == reg.address_offset:
-                addrmap_reg_list_strg['Offset']     = self.format_address(reg_previous.address_offset + reg_previous.total_size)
+            # Reserved addresses at the start or in between the address map
+            if covered_end < start:
+                addrmap_reg_list_strg['Offset']     = self.get_reserved_offset(covered_end, start, slot_size)
                 addrmap_reg_list_strg['Identifier'] = "-" 
                 addrmap_reg_list_strg['Name']       = "-"
                 self.pdf_create.create_reg_list_info(addrmap_reg_list_strg, 1)
 
-            # Reserved addresses in between the address map - for a range fo free spaces
-            elif (reg_id != 0) and (reg_previous.address_offset + reg_previous.total_size) < reg.address_offset:
-                start_addr = reg_previous.address_offset + reg_previous.total_size
+            # Next gap starts at the end of this register (memory or
+            # nested address map)
+            if end > covered_end:
+                covered_end = end
+                slot_size = entry.total_size if isinstance(entry, RegisterInfo) else None
 
-                index = 0
-                while((reg_previous.address_offset + reg_previous.total_size + index) < reg.address_offset):
-                    index = index + reg.total_size
-                    
-                end_addr = reg_previous.address_offset + reg_previous.total_size + index
+            if entry is None:
+                continue
 
-                offset_range = "%s till %s" % ((self.format_address(start_addr)),self.format_address(end_addr-1))
-                addrmap_reg_list_strg['Offset']     = offset_range 
-                addrmap_reg_list_strg['Identifier'] = "-" 
-                addrmap_reg_list_strg['Name']       = "-"
-                self.pdf_create.create_reg_list_info(addrmap_reg_list_strg, 1)
-
-            # Normal registers in the address map
-            addrmap_reg_list_strg['Offset']     = self.format_address(reg.address_offset) 
-            addrmap_reg_list_strg['Identifier'] = self.get_inst_name(reg)
-            addrmap_reg_list_strg['Id']         = "%s.%s" % ((root_id+1),(reg_id+1))
-            addrmap_reg_list_strg['Name']       = self.get_inst_name(reg)
+            # Normal registers (and memories) in the address map
+            if entry.array_dimensions is not None:
+                addrmap_reg_list_strg['Offset'] = self.get_array_address_offset_expr(entry)
+            elif isinstance(entry, MemoryInfo):
+                addrmap_reg_list_strg['Offset'] = self.format_address(entry.address_offset)
+            else:
+                addrmap_reg_list_strg['Offset'] = offsets[entry_id]
+            addrmap_reg_list_strg['Identifier'] = entry.inst_name
+            addrmap_reg_list_strg['Id']         = "%s.%s" % ((root_id+1),(entry_id+1))
+            addrmap_reg_list_strg['Name']       = entry.inst_name
             self.pdf_create.create_reg_list_info(addrmap_reg_list_strg, 0)
 
-            # Store previous item
-            reg_previous = reg
+            yield entry
 
         self.pdf_create.dump_reg_list_info()
 
     #####################################################################
     # Create the regiters info
     #####################################################################
-    def create_regmap_registers_info(self, node: AddrmapNode, root_id: int): 
+    def create_regmap_registers_info(self, addrmap: AddrmapInfo, root_id: int): 
         # Traverse all the registers for separate register(s) section
-        for reg_id, reg in enumerate(node.registers()):
-            registers_strg = {}
-            registers_strg['Name'] = "%s.%s %s" % ((root_id+1),(reg_id+1),self.get_inst_name(reg))
-            registers_strg['Desc1'] = self.get_name(reg)
-            registers_strg['Desc2'] = self.get_desc(reg)
-            registers_strg['Absolute_address'] = self.get_reg_absolute_address(reg)
-            registers_strg['Base_offset'] = self.get_reg_offset(reg)
-            registers_strg['Reset'] = self.get_reg_reset(reg)
-            registers_strg['Access'] = self.get_reg_access(reg)
-            registers_strg['Size'] = self.get_reg_size(reg)
-
-            self.pdf_create.create_register_info(registers_strg)
-
-            # Reverse the fields order - MSB first
-            fields_list = []
-            for field in reg.fields():
-                if isinstance(field, FieldNode):
-                    fields_list.append(field)
-
-            fields_list.reverse()
-
-            # Traverse all the fields
-            for field in fields_list:
-                fields_list_strg = {}
-                fields_list_strg['Bits']        = self.get_field_bits(field)
-                fields_list_strg['Identifier']  = self.get_inst_name(field)
-                fields_list_strg['Access']      = self.get_field_access(field)
-                fields_list_strg['Reset']       = self.get_field_reset(field)
-                fields_list_strg['Name']        = self.get_name(field)
-                fields_list_strg['Description'] = self.get_desc(field)
-
-                self.pdf_create.create_fields_list_info(fields_list_strg)
-
-            self.pdf_create.dump_field_list_info()
+        for reg_id, reg in enumerate(addrmap.registers):
+            self.create_regmap_register_info(reg, reg_id, root_id)
+
+    #####################################################################
+    # Create the memories info (one summary section per memory,
+    # after the register sections)
+    #####################################################################
+    def create_regmap_memories_info(self, addrmap: AddrmapInfo, root_id: int):
+        for mem_id, mem in enumerate(addrmap.memories, len(addrmap.registers)):
+            self.create_regmap_memory_info(mem, mem_id, root_id)
+
+    #####################################################################
+    # Create the summary of a single memory: its properties and the
+    # table of its virtual registers
+    #####################################################################
+    def create_regmap_memory_info(self, mem: MemoryInfo, mem_id: int, root_id: int):
+        memory_strg = {}
+        memory_strg['Name'] = "%s.%s %s" % ((root_id+1),(mem_id+1),mem.inst_name)
+        memory_strg['Desc1'] = mem.name
+        memory_strg['Desc2'] = mem.desc
+        memory_strg['Absolute_address'] = self.get_reg_absolute_address(mem)
+        memory_strg['Base_offset'] = self.get_reg_offset(mem)
+        memory_strg['Size'] = hex(mem.size)
+        memory_strg['Entries'] = str(mem.entries)
+        memory_strg['Width'] = str(mem.width)
+        memory_strg['Access'] = mem.access
+
+        self.pdf_create.create_memory_info(memory_strg)
+
+        # Offsets of the virtual registers (relative to the memory)
+        offsets = self.address_formatter.format_all([reg.address_offset for reg in mem.virtual_registers])
+
+        for reg_id, reg in enumerate(mem.virtual_registers):
+            vregs_list_strg = {}
+            if reg.array_dimensions is not None:
+                vregs_list_strg['Offset'] = self.get_array_address_offset_expr(reg)
+            else:
+                vregs_list_strg['Offset'] = offsets[reg_id]
+            vregs_list_strg['Identifier'] = reg.inst_name
+            vregs_list_strg['Name']       = reg.name
+            vregs_list_strg['Reset']      = self.get_reg_reset(reg)
+            vregs_list_strg['Access']     = reg.access
+
+            self.pdf_create.create_vregs_list_info(vregs_list_strg)
+
+        self.pdf_create.dump_vregs_list_info()
+
+    #####################################################################
+    # Create the info of a single register
+    #####################################################################
+    def create_regmap_register_info(self, reg: RegisterInfo, reg_id: int, root_id: int):
+        registers_strg = {}
+        registers_strg['Name'] = "%s.%s %s" % ((root_id+1),(reg_id+1),reg.inst_name)
+        registers_strg['Desc1'] = reg.name
+        registers_strg['Desc2'] = reg.desc
+        registers_strg['Absolute_address'] = self.get_reg_absolute_address(reg)
+        registers_strg['Base_offset'] = self.get_reg_offset(reg)
+        registers_strg['Reset'] = self.get_reg_reset(reg)
+        registers_strg['Access'] = reg.access
+        registers_strg['Size'] = self.get_reg_size(reg)
+
+        self.pdf_create.create_register_info(registers_strg)
+
+        # Same fields as an already rendered register of the same definition
+        if self.dedup_fields:
+            representative = self.find_same_layout(reg, registers_strg['Name'])
+            if representative is not None:
+                self.pdf_create.dump_field_list_reference(*representative)
+                return
+
+        # Traverse all the fields
+        for field in reg.fields:
+            fields_list_strg = {}
+            fields_list_strg['Bits']        = self.get_field_bits(field)
+            fields_list_strg['Identifier']  = field.inst_name
+            fields_list_strg['Access']      = field.access
+            fields_list_strg['Reset']       = self.get_field_reset(field)
+            fields_list_strg['Name']        = field.name
+            fields_list_strg['Description'] = field.desc
+
+            self.pdf_create.create_fields_list_info(fields_list_strg)
+
+        self.pdf_create.dump_field_list_info()
+
+    #####################################################################
+    # Find the first rendered register with the same definition and the
+    # same fields (the register is recorded as the representative if
+    # there is none)
+    # Returns the (title, anchor) of the representative or None
+    #####################################################################
+    def find_same_layout(self, reg: RegisterInfo, title: str) -> tuple:
+        if reg.type_name is None:
+            return None
+
+        representatives = self.namespace_db.setdefault(reg.type_name, [])
+        fields_digest = get_digest(reg.fields)
+
+        for rep_digest, rep_title in representatives:
+            if rep_digest == fields_digest:
+                return (rep_title, rep_title.replace(" ", ""))
+
+        representatives.append((fields_digest, title))
+        return None
 
     #####################################################################
     # Below methods are used for getting the required data from
@@ -231,11 +1136,24 @@ class PDFExporter:
         s = s.replace("  "," ")
         return s
 
-    def get_addrmap_size(self, node: Node) -> str:
+    def get_addrmap_size(self, addrmap: AddrmapInfo) -> str:
         # Get the hex value 
-        s = hex(node.size)
+        s = hex(addrmap.size)
         return s
 
+    def get_type_name(self, node: Node) -> str:
+        """
+        Returns the name of the original definition
+        (None for anonymous definitions)
+        """
+
+        original_def = node.inst.original_def
+
+        if original_def is None:
+            return None
+
+        return original_def.type_name
+
     def get_inst_name(self, node: Node) -> str:
         """
         Returns the class instance name
@@ -275,11 +1193,11 @@ class PDFExporter:
    
         # Get the upd value 
         amap = node.owning_addrmap
-        amap_name = amap.get_property("map_name_p", default=amap_name);
+        amap_name = self.property_cache.get_property(amap, "map_name_p", default=amap_name)
 
         return amap_name.upper()
 
-    def get_field_bits(self, field: FieldNode) -> str:
+    def get_field_bits(self, field: FieldInfo) -> str:
         """
         Get the bits [msb:lsb]
         """
@@ -367,33 +1285,12 @@ class PDFExporter:
             return "NOACCESS"
 
 
-    def get_field_reset(self, field: FieldNode) -> str:
+    def get_field_reset(self, field: FieldInfo) -> str:
         """
         Get the field reset value
         """
 
-        # Get the value 
-        field_reset = field.get_property('reset',default=0) 
-
-        # Format the value
-        field_width = field.width
-        no_of_nib = field_width/4
-
-        # 64bit data
-        if no_of_nib == 16:
-            format_number = no_of_nib + 3
-        # 32bit data
-        elif no_of_nib == 8:
-            format_number = no_of_nib + 1
-        #  16bit or 8bit data     
-        else:
-            format_number = no_of_nib 
-
-        # format the string to have underscore in hex value
-        format_str = '{:0' + str(int(format_number)) + '_x}'
-        final_value = (format_str.format(field_reset))
-
-        return (str(field_width) +"'h"+ final_value.upper())
+        return get_formatter(field.width).format(field.reset)
 
 
     def get_mem_access(self, mem: MemNode) -> str:
@@ -403,14 +1300,18 @@ class PDFExporter:
         else:
             return "RW"
 
-    def get_reg_absolute_address(self, node: RegNode) -> str:
+    def get_reg_absolute_address(self, reg: RegisterInfo) -> str:
         #abs_addr = self.absolute_address
-        abs_addr = self.base_address + node.address_offset
+        abs_addr = self.base_address + reg.address_offset
         s = self.format_address(abs_addr)
+        if reg.array_dimensions is not None:
+            s += self.get_array_index_expr(reg)
         return s
 
-    def get_reg_offset(self, node: RegNode) -> str:
-        add_offset = node.address_offset
+    def get_reg_offset(self, reg: RegisterInfo) -> str:
+        if reg.array_dimensions is not None:
+            return self.get_array_address_offset_expr(reg)
+        add_offset = reg.address_offset
         s = self.format_address(add_offset)
         return s
 
@@ -429,64 +1330,44 @@ class PDFExporter:
             return regaccess
    
         # Get the upd value 
-        regaccess = node.get_property("regaccess_p", default=regaccess)
+        regaccess = self.property_cache.get_property(node, "regaccess_p", default=regaccess)
 
         return regaccess
 
-    def get_reg_reset(self, node: RegNode) -> str:
+    def get_reg_reset(self, reg: RegisterInfo) -> str:
         """
-        Concatenate the value of the individual fields
-        to form the register value
+        Get the register reset value, the concatenation of
+        the individual fields values
         """
 
-        reg_reset = 0;
-        
-        # Deduce the reset value
-        for field in node.fields():
-            if isinstance(field, FieldNode):
-                field_reset = field.get_property('reset',default=0) 
-                field_lsb_pos = field.lsb
-                reg_reset |= field_reset << field_lsb_pos
-        
+        return get_formatter(reg.width).format(reg.reset)
 
-        # Format the value
-        register_width = node.get_property('regwidth')
-        no_of_nib = register_width/4
-
-        # 64bit data
-        if no_of_nib == 16:
-            format_number = no_of_nib + 3
-        # 32bit data
-        elif no_of_nib == 8:
-            format_number = no_of_nib + 1
-        #  16bit or 8bit data     
-        else:
-            format_number = no_of_nib 
+    def get_reserved_offset(self, start_addr: int, end_addr: int, slot_size: int) -> str:
+        """
+        Get the offset of the reserved space [start_addr, end_addr)
 
-        # format the string to have underscore in hex value
-        format_str = '{:0' + str(int(format_number)) + '_x}'
-        final_value = (format_str.format(reg_reset))
+        A gap of exactly one slot (size of the previous register) is
+        shown as a single address, otherwise as an address range
+        """
 
-        return (str(register_width) +"'h"+ final_value.upper())
+        if (end_addr - start_addr) == slot_size:
+            return self.format_address(start_addr)
+        else:
+            return "%s till %s" % (self.format_address(start_addr), self.format_address(end_addr-1))
 
-    def get_reg_size(self, node: RegNode) -> str:
+    def get_reg_size(self, reg: RegisterInfo) -> str:
         """
         Get the size of the register
         """
 
-        return (hex(node.total_size))
+        return (hex(reg.total_size))
 
     def check_udp(self, prop_name: str, node: Node) -> bool:
         """
         Checks if the property name is a udp
         """
 
-        prop_ups = node.list_properties(include_native=False, include_udp=True)
-
-        if prop_name in prop_ups:
-            return True
-        else:
-            return False
+        return self.property_cache.has_udp(prop_name, node)
 
     def get_address_width(self, node: Node) -> str:
         """
@@ -505,17 +1386,18 @@ class PDFExporter:
             return address_width
    
         # Get the upd value 
-        address_width = amap.get_property("address_width_p", default=address_width);
+        address_width = self.property_cache.get_property(amap, "address_width_p", default=address_width)
     
         return (int(address_width)) 
 
-    def get_base_address(self, node: Node) -> str:
+    def get_base_address(self, node: Node, default: int = 0x0) -> int:
         """
         Returns the base address for the register block 
+        (default if the base_address_p udp is not set)
         """
        
         # Default value 
-        base_address = 0x0
+        base_address = default
 
         # Get the property value
         amap = node.owning_addrmap
@@ -524,31 +1406,17 @@ class PDFExporter:
         is_defined = self.check_udp("base_address_p", node)
         
         if not is_defined:
-            return (self.format_address(base_address)) 
+            return base_address
 
         # Get the value
-        base_address = amap.get_property("base_address_p", default=base_address);
-
-        return (self.format_address(base_address)) 
+        base_address = self.property_cache.get_property(amap, "base_address_p", default=base_address)
 
-    def format_address(self, address: str) -> str:
+        return base_address
 
-        no_of_nib = self.address_width/4
+    def format_address(self, address: int) -> str:
+        return self.address_formatter.format(address)
 
-        # 64bit address
-        if no_of_nib == 16:
-            format_number = no_of_nib + 3
-        # 32bit address     
-        else:
-            format_number = no_of_nib +1
-
-        # format the string to have underscore in hex value
-        format_str = '{:0' + str(int(format_number)) + '_x}'
-        final_value = (format_str.format(address))
-
-        return (str(self.address_width) +"'h"+ final_value.upper())
-
-    def get_array_address_offset_expr(self, node: AddressableNode) -> str:
+    def get_array_address_offset_expr(self, reg: RegisterInfo) -> str:
         """
         Returns an expression to calculate the address offset
         for example, a 4-dimensional array allocated as:
@@ -556,13 +1424,22 @@ class PDFExporter:
         results in:
             X + i0*B*C*D*Y + i1*C*D*Y + i2*D*Y + i3*Y
         """
-        s = "'h%x" % node.raw_address_offset
-        if node.is_array:
-            for i in range(len(node.array_dimensions)):
-                m = node.array_stride
-                for j in range(i+1, len(node.array_dimensions)):
-                    m *= node.array_dimensions[j]
-                s += " + i%d*'h%x" % (i, m)
+        s = "'h%x" % reg.address_offset
+        if reg.array_dimensions is not None:
+            s += self.get_array_index_expr(reg)
+        return s
+
+    def get_array_index_expr(self, reg: RegisterInfo) -> str:
+        """
+        Returns the index terms of the array address expression
+        (see get_array_address_offset_expr)
+        """
+        s = ""
+        for i in range(len(reg.array_dimensions)):
+            m = reg.array_stride
+            for j in range(i+1, len(reg.array_dimensions)):
+                m *= reg.array_dimensions[j]
+            s += " + i%d*'h%x" % (i, m)
         return s
 
 
@@ -576,11 +1453,11 @@ class PDFExporter:
             return "UVM_NO_ENDIAN"
 
 
-    def get_bus_width(self, node: Node) -> int:
+    def get_bus_width(self, width: int) -> int:
         """
-        Returns group-like node's bus width (in bytes)
+        Returns the bus width in bytes of a group-like node from the max
+        accesswidth/memwidth in bits of its descendants
         """
-        width = self.bus_width_db[node.get_path()]
 
         # Divide by 8, rounded up
         if width % 8:
@@ -0,0 +1,186 @@
+import time
+
+from systemrdl import RDLListener, WalkerAction
+
+from .instrumentation import get_traced_memory, get_memory_delta, add_memory
+
+class RegfileScope:
+    """
+    One element of a regfile (or the address map itself) being walked
+
+    prefix is the hierarchical path of the element relative to the address
+    map (e.g. "RF[1]."), offset its address offset relative to the address
+    map, registers collects the registers of the element in address map order
+    """
+    __slots__ = ('prefix', 'offset', 'registers')
+
+    def __init__(self, prefix: str, offset: int):
+        self.prefix = prefix
+        self.offset = offset
+        self.registers = []
+
+class AddrmapContext:
+    """
+    Address map being walked
+    """
+    __slots__ = ('node', 'instance_bases', 'scopes_stack', 'memories', 'submaps',
+                 'start_time', 'nested_time', 'start_memory', 'nested_memory')
+
+    def __init__(self, node, instance_bases: list):
+        self.node = node
+
+        # Absolute base of each instance (elements of the enclosing
+        # address map arrays times the elements of this one)
+        self.instance_bases = instance_bases
+
+        # Scopes of the regfiles being walked, the address map scope first
+        self.scopes_stack = [[RegfileScope("", 0)]]
+
+        self.memories = []
+        self.submaps = []
+
+        # Extraction time (and traced memory), without the nested
+        # address maps
+        self.start_time = time.perf_counter()
+        self.nested_time = 0.0
+        self.start_memory = get_traced_memory()
+        self.nested_memory = None
+
+class ExtractListener(RDLListener):
+    """
+    Extracts the rendering jobs (root_id, AddrmapInfo) of a root in a
+    single depth-first walk (RDLWalker, unroll=False)
+
+    The address maps are emitted in post order (nested address maps
+    first). The registers of the regfiles are part of their address map,
+    with the hierarchical path of the regfile as the prefix of their
+    instance name. Regfile arrays are expanded, register arrays are
+    expanded or collapsed like the registers of the address map.
+
+    Every node is entered once, the fields of the registers and the
+    content of the memories are read by the exporter without walking them.
+
+    The bus width of each address map (max accesswidth/memwidth of its
+    descendants, the regfiles included) is passed to extract_addrmap.
+    """
+
+    def __init__(self, exporter, root_id: int):
+        self.exporter = exporter
+        self.root_id = root_id
+
+        # Extracted jobs, in document order
+        self.jobs = []
+
+        # Address maps being walked (innermost last)
+        self.addrmap_stack = []
+
+        # Max width in bits of each group (addrmap, regfile) being walked
+        self.max_width_stack = []
+
+    def enter_Addrmap(self, node):
+        # The absolute bases are resolved top-down: the base of each
+        # instance of the enclosing address map plus the offset of each
+        # element in it (0 for the walked node). The base_address_p udp,
+        # if it is set, moves all the instances with the first one
+        if self.addrmap_stack:
+            offsets = [offset for suffix, offset in self.exporter.iter_array_elements(node)]
+            instance_bases = [base + offset
+                              for base in self.addrmap_stack[-1].instance_bases
+                              for offset in offsets]
+        else:
+            instance_bases = [0]
+
+        base_address = self.exporter.get_base_address(node, instance_bases[0])
+        shift = base_address - instance_bases[0]
+        if shift:
+            instance_bases = [base + shift for base in instance_bases]
+
+        self.addrmap_stack.append(AddrmapContext(node, instance_bases))
+        self.max_width_stack.append(0)
+
+    def exit_Addrmap(self, node):
+        bus_width = self.exit_group()
+
+        context = self.addrmap_stack.pop()
+        registers = context.scopes_stack[0][0].registers
+
+        addrmap = self.exporter.extract_addrmap(node, registers, context.memories,
+                                                context.submaps, context.instance_bases,
+                                                bus_width)
+        self.jobs.append((self.root_id, addrmap))
+
+        duration = time.perf_counter() - context.start_time
+        memory = get_memory_delta(context.start_memory)
+        if self.addrmap_stack:
+            self.addrmap_stack[-1].nested_time += duration
+            self.addrmap_stack[-1].nested_memory = add_memory(self.addrmap_stack[-1].nested_memory,
+                                                              memory)
+            self.addrmap_stack[-1].submaps.append((self.exporter.get_inst_name(node),
+                                                   node.raw_address_offset,
+                                                   node.total_size))
+
+        if self.exporter.instrumentation is not None:
+            if memory is not None and context.nested_memory is not None:
+                memory -= context.nested_memory
+            self.exporter.instrumentation.add("extract", duration - context.nested_time,
+                                              self.root_id, addrmap.name, memory)
+
+    def enter_Regfile(self, node):
+        context = self.addrmap_stack[-1]
+        inst_name = self.exporter.get_inst_name(node)
+
+        # One scope per element of each enclosing scope
+        scopes = []
+        for parent in context.scopes_stack[-1]:
+            for suffix, offset in self.exporter.iter_array_elements(node):
+                scopes.append(RegfileScope(parent.prefix + inst_name + suffix + ".",
+                                           parent.offset + offset))
+        context.scopes_stack.append(scopes)
+        self.max_width_stack.append(0)
+
+    def exit_Regfile(self, node):
+        self.exit_group()
+
+        context = self.addrmap_stack[-1]
+        scopes = context.scopes_stack.pop()
+
+        # The elements are ordered by their enclosing scope,
+        # so the registers stay in address map order
+        elements = len(scopes) // len(context.scopes_stack[-1])
+        for parent_id, parent in enumerate(context.scopes_stack[-1]):
+            for scope in scopes[parent_id*elements:(parent_id+1)*elements]:
+                parent.registers.extend(scope.registers)
+
+    def enter_Reg(self, node):
+        context = self.addrmap_stack[-1]
+        self.update_width(node.get_property("accesswidth"))
+
+        reg_info = self.exporter.extract_register(node)
+        for scope in context.scopes_stack[-1]:
+            scope.registers.extend(self.exporter.place_register(node, reg_info, scope.prefix,
+                                                                scope.offset))
+
+        # The fields are read by extract_register
+        return WalkerAction.SkipDescendants
+
+    def enter_Mem(self, node):
+        self.update_width(node.get_property("memwidth"))
+        self.addrmap_stack[-1].memories.append(self.exporter.extract_memory(node))
+
+        # The virtual registers are read by extract_memory
+        return WalkerAction.SkipDescendants
+
+    def update_width(self, width: int):
+        self.max_width_stack[-1] = max(width, self.max_width_stack[-1])
+
+    def exit_group(self) -> int:
+        """
+        Returns the max width in bits of the group being exited
+        """
+        max_width = self.max_width_stack.pop()
+
+        # Propagate max width to parent
+        if self.max_width_stack:
+            self.update_width(max_width)
+
+        return max_width
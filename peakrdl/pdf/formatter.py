@@ -0,0 +1,62 @@
+############################################################################
+# Formatting of the addresses and the reset values
+#
+# A formatter is built once per (width, style) pair and reused for all the
+# values of that width, e.g. for width = 32:
+#   "verilog" - 32'h0000_1000
+#   "c"       - 0x0000_1000
+# The hex digits are grouped by 4 with underscores.
+############################################################################
+
+# Prefix of each style (formatted with the width)
+FORMAT_STYLES = {
+    "verilog": "{width}'h",
+    "c": "0x",
+}
+
+class HexFormatter:
+    """
+    Formats integers of a given width
+    """
+    __slots__ = ('width', 'style', 'format')
+
+    def __init__(self, width: int, style: str):
+        if style not in FORMAT_STYLES:
+            raise ValueError("Not a valid format style '%s'" % style)
+
+        self.width = width
+        self.style = style
+
+        # Hex digits (rounded up) and the underscores in between them
+        digits = max((width + 3) // 4, 1)
+        length = digits + (digits - 1) // 4
+
+        prefix = FORMAT_STYLES[style].format(width=width)
+
+        # Bound method of the format string, e.g. "32'h{:09_X}".format
+        self.format = (prefix + "{:0%d_X}" % length).format
+
+    def format_all(self, values: list) -> list:
+        """
+        Formats a whole column of values
+        """
+
+        return list(map(self.format, values))
+
+# Dictionary of the built formatters
+# key = (width, style)
+# value = HexFormatter
+_formatters = {}
+
+def get_formatter(width: int, style: str = "verilog") -> HexFormatter:
+    """
+    Returns the formatter for the (width, style) pair
+    """
+
+    formatter = _formatters.get((width, style))
+
+    if formatter is None:
+        formatter = HexFormatter(width, style)
+        _formatters[(width, style)] = formatter
+
+    return formatter
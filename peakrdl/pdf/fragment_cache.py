@@ -0,0 +1,89 @@
+import os
+import json
+import shutil
+
+############################################################################
+# On-disk cache of the rendered address map fragments
+#
+# Each entry is stored as two files in the cache directory:
+#   <digest>.pdf  - the rendered fragment
+#   <digest>.json - the number of pages and the TOC entries of the fragment
+# where digest is the content hash of the address map data.
+#
+# The least recently used entries are evicted once the total size of the
+# cache is above max_size (in bytes).
+############################################################################
+class FragmentCache:
+
+    def __init__(self, cache_dir: str, max_size: int):
+        """
+        Constructor for the Fragment Cache class
+        """
+
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get_path(self, digest: str) -> str:
+        """
+        Returns the path of the cached fragment
+        """
+
+        return os.path.join(self.cache_dir, digest + ".pdf")
+
+    def get(self, digest: str) -> tuple:
+        """
+        Returns the (page count, TOC entries) of the cached fragment,
+        or None if the fragment is not in the cache
+        """
+
+        info_path = os.path.join(self.cache_dir, digest + ".json")
+
+        if not (os.path.exists(info_path) and os.path.exists(self.get_path(digest))):
+            return None
+
+        with open(info_path) as f:
+            info = json.load(f)
+
+        # Mark the entry as recently used
+        os.utime(info_path)
+        os.utime(self.get_path(digest))
+
+        toc_entries = [tuple(entry) for entry in info['toc_entries']]
+        return (info['page_count'], toc_entries)
+
+    def put(self, digest: str, fragment_path: str, page_count: int, toc_entries: list):
+        """
+        Stores the rendered fragment
+        """
+
+        shutil.copyfile(fragment_path, self.get_path(digest))
+
+        # Written last, an entry without it is not valid
+        info_path = os.path.join(self.cache_dir, digest + ".json")
+        with open(info_path, "w") as f:
+            json.dump({'page_count': page_count, 'toc_entries': toc_entries}, f)
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits
+        into max_size
+        """
+
+        entries = []
+        total_size = 0
+        for file_name in os.listdir(self.cache_dir):
+            file_path = os.path.join(self.cache_dir, file_name)
+            file_stat = os.stat(file_path)
+            entries.append((file_stat.st_mtime, file_stat.st_size, file_path))
+            total_size += file_stat.st_size
+
+        # Oldest first
+        entries.sort()
+
+        for mtime, size, file_path in entries:
+            if total_size <= self.max_size:
+                break
+            os.remove(file_path)
+            total_size -= size
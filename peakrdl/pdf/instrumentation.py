@@ -0,0 +1,263 @@
+import time
+import tracemalloc
+
+############################################################################
+# Instrumentation of the export stages
+#
+# The exporter reports each stage (extract, flowables, layout, layout pass,
+# write, ...) of each root and address map as a StageRecord. The records
+# are collected, passed to an optional callback and summarized by report().
+#
+#   instrumentation = Instrumentation(callback=print, trace_memory=True)
+#   exporter.export(roots, "out.pdf", instrumentation=instrumentation)
+#   print(instrumentation.report())
+#
+# Stages can also be timed by the user code with the same API:
+#   with instrumentation.stage("compile", root_id=0):
+#       ...
+############################################################################
+
+############################################################################
+# Traced memory, for the stages measured inside reportlab (layout passes,
+# sections, write) and the walk (extract) which can not be wrapped in a
+# stage context manager
+############################################################################
+def get_traced_memory() -> int:
+    """
+    Returns the traced memory in bytes (None if tracemalloc is not tracing)
+    """
+    if not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()[0]
+
+def get_memory_delta(start_memory: int) -> int:
+    """
+    Returns the memory allocated since start_memory (get_traced_memory),
+    None if it was not traced
+    """
+    if start_memory is None or not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()[0] - start_memory
+
+def add_memory(total: int, memory: int) -> int:
+    """
+    Returns the sum of two memory deltas (None if neither was traced)
+    """
+    if total is None:
+        return memory
+    if memory is None:
+        return total
+    return total + memory
+
+
+class StageRecord:
+    """
+    Time (in seconds) and memory (traced allocation change in bytes, None
+    if not traced) of one stage
+    """
+    __slots__ = ('name', 'root_id', 'addrmap', 'duration', 'memory')
+
+    def __init__(self, name: str, root_id: int, addrmap: str, duration: float, memory: int):
+        self.name = name
+        self.root_id = root_id
+        self.addrmap = addrmap
+        self.duration = duration
+        self.memory = memory
+
+    def __repr__(self):
+        s = "%s: %.3fs" % (self.name, self.duration)
+        if self.addrmap is not None:
+            s = "%s (root %s) %s" % (self.addrmap, self.root_id, s)
+        if self.memory is not None:
+            s += " %+d KB" % (self.memory // 1024)
+        return s
+
+
+class _Stage:
+    """
+    Context manager timing one stage
+    """
+
+    def __init__(self, instrumentation, name: str, root_id: int, addrmap: str):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.root_id = root_id
+        self.addrmap = addrmap
+
+    def __enter__(self):
+        if self.instrumentation.trace_memory:
+            self.start_memory = tracemalloc.get_traced_memory()[0]
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = time.perf_counter() - self.start_time
+
+        memory = None
+        if self.instrumentation.trace_memory:
+            memory = tracemalloc.get_traced_memory()[0] - self.start_memory
+
+        self.instrumentation.add(self.name, duration, self.root_id, self.addrmap, memory)
+        return False
+
+
+class _NoStage:
+    """
+    Context manager used when there is no instrumentation
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+NO_STAGE = _NoStage()
+
+
+class Instrumentation:
+
+    def __init__(self, callback=None, trace_memory: bool = False):
+        """
+        Constructor for the Instrumentation class
+
+        callback: callable
+            Called as callback(record) for each StageRecord
+
+        trace_memory: bool
+            If True, the memory allocated by each stage is traced
+            (tracemalloc is started if it is not running)
+        """
+
+        self.callback = callback
+        self.trace_memory = trace_memory
+
+        # All the records, in the order the stages ended
+        self.records = []
+
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stage(self, name: str, root_id: int = None, addrmap: str = None) -> _Stage:
+        """
+        Returns a context manager which records the stage when it exits
+        """
+
+        return _Stage(self, name, root_id, addrmap)
+
+    def add(self, name: str, duration: float, root_id: int = None, addrmap: str = None,
+            memory: int = None):
+        """
+        Adds the record of a stage which was timed elsewhere
+        """
+
+        record = StageRecord(name, root_id, addrmap, duration, memory)
+        self.records.append(record)
+
+        if self.callback is not None:
+            self.callback(record)
+
+    def get_totals(self) -> dict:
+        """
+        Returns the total duration of each stage
+        """
+
+        totals = {}
+        for record in self.records:
+            totals[record.name] = totals.get(record.name, 0.0) + record.duration
+        return totals
+
+    def get_memory_totals(self) -> dict:
+        """
+        Returns the total memory of each stage (None if it was not traced)
+        """
+
+        totals = {}
+        for record in self.records:
+            totals[record.name] = add_memory(totals.get(record.name), record.memory)
+        return totals
+
+    def get_addrmap_totals(self) -> dict:
+        """
+        Returns the durations of the stages of each address map
+        key = (root id, address map name)
+        value = dictionary of the stage durations
+        """
+
+        totals = {}
+        for record in self.records:
+            if record.addrmap is None:
+                continue
+            stages = totals.setdefault((record.root_id, record.addrmap), {})
+            stages[record.name] = stages.get(record.name, 0.0) + record.duration
+        return totals
+
+    def get_addrmap_memory_totals(self) -> dict:
+        """
+        Returns the total memory of the stages of each address map
+        key = (root id, address map name)
+        value = total memory (None if it was not traced)
+        """
+
+        totals = {}
+        for record in self.records:
+            if record.addrmap is None:
+                continue
+            key = (record.root_id, record.addrmap)
+            totals[key] = add_memory(totals.get(key), record.memory)
+        return totals
+
+    def format_memory(self, memory: int) -> str:
+        """
+        Returns the memory in KB ("-" if it was not traced)
+        """
+
+        if memory is None:
+            return "%10s" % "-"
+        return "%+8d KB" % (memory // 1024)
+
+    def report(self, top: int = 10) -> str:
+        """
+        Returns the summary of the stages and of the slowest address maps
+        (with the memory of each if it is traced)
+
+        The layout passes are a breakdown of the layout stage (the same
+        time), they are listed below it
+        """
+
+        totals = self.get_totals()
+        memory_totals = self.get_memory_totals()
+
+        # Layout passes after the layout stage
+        names = [name for name in totals if not name.startswith("layout pass")]
+        passes = [name for name in totals if name.startswith("layout pass")]
+        if "layout" in names:
+            position = names.index("layout") + 1
+            names[position:position] = passes
+        else:
+            names += passes
+
+        lines = ["Stages:"]
+        for name in names:
+            label = name
+            if name in passes:
+                label = "  " + name
+            line = "    %-20s %8.3fs" % (label, totals[name])
+            if self.trace_memory:
+                line += "  " + self.format_memory(memory_totals[name])
+            lines.append(line)
+
+        addrmap_memory = self.get_addrmap_memory_totals()
+        addrmaps = sorted(self.get_addrmap_totals().items(),
+                          key=lambda item: sum(item[1].values()), reverse=True)
+        if addrmaps:
+            lines.append("Slowest address maps:")
+            for (root_id, addrmap), stages in addrmaps[:top]:
+                details = ", ".join("%s %.3fs" % item for item in stages.items())
+                memory = ""
+                if self.trace_memory:
+                    memory = "  " + self.format_memory(addrmap_memory[(root_id, addrmap)])
+                lines.append("    %-30s %8.3fs%s  (root %d: %s)" %
+                             (addrmap, sum(stages.values()), memory, root_id, details))
+
+        return "\n".join(lines)
@@ -0,0 +1,120 @@
+import os
+import re
+import zlib
+import pickle
+import hashlib
+
+from .fragment_cache import FragmentCache
+
+############################################################################
+# On-disk cache of the extracted register map model
+#
+# The rendering jobs (root_id, AddrmapInfo) extracted from a set of input
+# .rdl files are stored as one compressed pickle file:
+#   <digest>.model
+# where digest is the hash of the contents of the input files, of all the
+# files they `include, of the include search paths and of the export
+# options which change the extracted model.
+#
+# A docs-only rerun with unchanged inputs reads the model back, without
+# compiling and elaborating the input files.
+#
+# Like the fragment cache, the least recently used models are evicted once
+# the total size of the cache is above max_size (in bytes).
+############################################################################
+
+# `include "file"
+_INCLUDE_RE = re.compile(r'`include\s+"([^"]+)"')
+
+def find_included_files(input_file: str, incl_search_paths: list) -> list:
+    """
+    Returns the input file and all the files it includes (recursively)
+    """
+
+    files = []
+    pending = [input_file]
+
+    while pending:
+        file_path = pending.pop(0)
+        if file_path in files:
+            continue
+        files.append(file_path)
+
+        with open(file_path, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+
+        for include in _INCLUDE_RE.findall(text):
+            # Relative to the including file first, then the search paths
+            search_paths = [os.path.dirname(file_path)] + list(incl_search_paths)
+            for search_path in search_paths:
+                include_path = os.path.join(search_path, include)
+                if os.path.isfile(include_path):
+                    pending.append(include_path)
+                    break
+
+    return files
+
+
+class ModelCache(FragmentCache):
+
+    def __init__(self, cache_dir: str, max_size: int):
+        """
+        Constructor for the Model Cache class
+        """
+
+        FragmentCache.__init__(self, cache_dir, max_size)
+
+    def get_digest(self, input_files: list, incl_search_paths: list, options: tuple) -> str:
+        """
+        Returns the hash of the input files (and their includes),
+        the include search paths and the export options
+        """
+
+        digest = hashlib.sha256()
+        digest.update(repr((list(incl_search_paths), options)).encode())
+
+        for input_file in input_files:
+            for file_path in find_included_files(input_file, incl_search_paths):
+                with open(file_path, "rb") as f:
+                    digest.update(file_path.encode())
+                    digest.update(hashlib.sha256(f.read()).digest())
+
+        return digest.hexdigest()
+
+    def get_path(self, digest: str) -> str:
+        """
+        Returns the path of the cached model
+        """
+
+        return os.path.join(self.cache_dir, digest + ".model")
+
+    def get(self, digest: str) -> list:
+        """
+        Returns the cached jobs, or None if the model is not in the cache
+        """
+
+        if not os.path.exists(self.get_path(digest)):
+            return None
+
+        with open(self.get_path(digest), "rb") as f:
+            jobs = pickle.loads(zlib.decompress(f.read()))
+
+        # Mark the model as recently used
+        os.utime(self.get_path(digest))
+
+        return jobs
+
+    def put(self, digest: str, jobs: list):
+        """
+        Stores the jobs, then evicts the least recently used models
+        """
+
+        data = zlib.compress(pickle.dumps(jobs, protocol=pickle.HIGHEST_PROTOCOL))
+
+        # Written under a temporary name, a partly written model is never read
+        tmp_path = self.get_path(digest) + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.get_path(digest))
+
+        self.evict()
@@ -0,0 +1,182 @@
+import datetime
+
+############################################################################
+# Page decorations of the document (first page and later pages)
+#
+# The static part of each page layout (logo, lines, title, footer) is drawn
+# once per document into a form XObject, which every page then references.
+# The logo is decoded once per template and shared by all the documents
+# built with it. Only the page number is drawn on each page.
+#
+# Custom layouts subclass PageTemplate and override the draw_* methods:
+#
+#   class MyTemplate(PageTemplate):
+#       def draw_first_page(self, canvas):
+#           ...
+#
+#   exporter.export(roots, "out.pdf", page_template=MyTemplate(logo="logo.png"))
+#
+# reportlab is only imported when the logo is loaded, so importing this
+# module stays cheap.
+############################################################################
+
+# Document text color
+DOC_COLOR = "#24001e"
+
+class PageTemplate:
+
+    # Names of the form XObjects of the static page layouts
+    first_page_form = "PageTemplateFirstPage"
+    later_pages_form = "PageTemplateLaterPages"
+
+    def __init__(self, logo: str = "example_logo.png"):
+        """
+        Constructor for the Page Template class
+
+        logo: str
+            Path of the logo image (None - no logo)
+        """
+
+        self.logo = logo
+
+        # Decoded logo (ImageReader), loaded by the first page
+        self.logo_image = None
+
+    ############################################################################
+    # Returns the decoded logo (None if there is no logo)
+    ############################################################################
+    def get_logo_image(self):
+        if self.logo is not None and self.logo_image is None:
+            from reportlab.lib.utils import ImageReader # pylint: disable=import-outside-toplevel
+
+            self.logo_image = ImageReader(self.logo)
+
+        return self.logo_image
+
+    ############################################################################
+    # The decoded logo is not pickled (the template is sent to the worker
+    # processes of export_batch), each process loads it again
+    ############################################################################
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['logo_image'] = None
+        return state
+
+    ############################################################################
+    # Page callbacks of the document template (onFirstPage, onLaterPages)
+    ############################################################################
+    def on_first_page(self, canvas, doc):
+        self.draw_form(canvas, self.first_page_form, self.draw_first_page)
+
+    def on_later_pages(self, canvas, doc):
+        self.draw_form(canvas, self.later_pages_form, self.draw_later_pages)
+        self.draw_page_number(canvas)
+
+    ############################################################################
+    # Draw the form on the current page, the form is defined by the first
+    # page of each document (canvas) which uses it
+    ############################################################################
+    def draw_form(self, canvas, name: str, draw):
+        if not canvas.hasForm(name):
+            canvas.beginForm(name)
+            draw(canvas)
+            canvas.endForm()
+
+        canvas.doForm(name)
+
+    ############################################################################
+    # Static layout of the first page
+    ############################################################################
+    def draw_first_page(self, canvas):
+        canvas.saveState()
+
+        # Logo
+        if self.get_logo_image() is not None:
+            canvas.drawImage(self.get_logo_image(),405,720,width=140,height=60,
+                             preserveAspectRatio=True,mask='auto')
+
+        # Example FPGA
+        canvas.setFillColor("#18325e")
+        canvas.setFont('Helvetica-Bold', 22)
+        canvas.drawString(380, 620, 'Example')
+
+        canvas.setFont('Helvetica', 19)
+        canvas.drawString(478, 620, 'FPGA ')
+
+        # Line
+        canvas.setStrokeColor("#4d82bb")
+        canvas.setLineWidth(1.2)
+        canvas.line(60,610,532,610)
+
+        # Example Register Specification
+        canvas.setFillColor(DOC_COLOR)
+        canvas.setFont('Times-Bold', 25)
+        canvas.drawString(181, 500, ' Example Registers Specification')
+
+        # Date of creation (yyyy-Month-dd)
+        canvas.setFillColor(DOC_COLOR)
+        canvas.setFont('Times-Roman', 14)
+        today_date = datetime.date.today().strftime('%Y-%b-%d')
+        canvas.drawString(460, 420, today_date)
+
+        # First page Footer
+        canvas.setFillColor("red")
+        canvas.setFont('Times-Roman', 8)
+        canvas.drawString(265, 110, 'Example Corporation')
+
+        canvas.setFillColor(DOC_COLOR)
+        canvas.setFont('Times-Bold', 8)
+        canvas.drawString(250, 100, 'Proprietary and Confidential')
+
+        canvas.setFillColor(DOC_COLOR)
+        canvas.setFont('Times-Roman', 8)
+        strg = "Copyright \xa9 " + datetime.date.today().strftime('%Y') + "  - Example Corporation, All Rights Reserved"
+        canvas.drawString(200, 90, strg)
+
+        canvas.restoreState()
+
+    ############################################################################
+    # Static layout of the later pages (header and footer)
+    ############################################################################
+    def draw_later_pages(self, canvas):
+        canvas.saveState()
+
+        # Header logo
+        if self.get_logo_image() is not None:
+            canvas.drawImage(self.get_logo_image(),500,790,width=70,height=30,
+                             preserveAspectRatio=True,mask='auto')
+
+        # Footer line
+        canvas.setStrokeColor("#4d82bb")
+        canvas.setLineWidth(0.8)
+        canvas.line(60,70,532,70)
+
+        # Footer date (yyyy-mm-dd)
+        canvas.setFillColor(DOC_COLOR)
+        canvas.setFont('Times-Roman', 10)
+        today_date = datetime.date.today().strftime('%Y-%m-%d')
+        canvas.drawString(60, 55, today_date)
+
+        # Footer Info
+        canvas.setFillColor(DOC_COLOR)
+        canvas.setFont('Times-Bold', 8)
+        canvas.drawString(260, 60, 'Proprietary and Confidential')
+
+        canvas.setFillColor(DOC_COLOR)
+        canvas.setFont('Times-Roman', 8)
+        strg = "Copyright \xa9 " + datetime.date.today().strftime('%Y') + " - Example Corporation, All Rights Reserved"
+        canvas.drawString(200, 50, strg)
+
+        canvas.restoreState()
+
+    ############################################################################
+    # Page number of the later pages (drawn on each page)
+    ############################################################################
+    def draw_page_number(self, canvas):
+        canvas.saveState()
+
+        canvas.setFillColor(DOC_COLOR)
+        canvas.setFont('Times-Roman', 10)
+        canvas.drawString(500, 55, "Page %s" % canvas.getPageNumber())
+
+        canvas.restoreState()
@@ -0,0 +1,164 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from .__about__ import __version__
+from .pdf_creator import PDFCreator, create_page_decorations
+from .regmap_model import AddrmapInfo, get_digest
+
+############################################################################
+# Fragment based rendering of the address maps
+#
+# Each address map is rendered into its own PDF fragment in a process
+# pool. The fragments are then merged behind the first page and the TOC,
+# the page numbers of the TOC entries are shifted to their final position
+# and the page decorations are laid over the merged pages.
+#
+# Fragments of unchanged address maps can be reused from a FragmentCache.
+#
+# Merging the fragments requires the pypdf package.
+############################################################################
+
+def render_fragment(addrmap: AddrmapInfo, root_id: int, key_prefix: str, path: str,
+                    dedup_fields: bool) -> tuple:
+    """
+    Render one address map into a PDF fragment (runs in a worker process)
+
+    Returns the number of pages and the TOC entries of the fragment
+    """
+
+    # Importing here to avoid a circular import
+    from .exporter import PDFExporter # pylint: disable=import-outside-toplevel
+
+    exporter = PDFExporter()
+    exporter.dedup_fields = dedup_fields
+    exporter.pdf_create = PDFCreator(path, fragment=True, key_prefix=key_prefix)
+    exporter.create_regmap_list(addrmap, root_id)
+    exporter.create_regmap_registers_info(addrmap, root_id)
+    exporter.create_regmap_memories_info(addrmap, root_id)
+
+    return exporter.pdf_create.build_fragment()
+
+
+def build_from_fragments(jobs: list, path: str, workers: int, cache=None,
+                         dedup_fields: bool = False, page_template=None) -> list:
+    """
+    Render the (root_id, AddrmapInfo) jobs with the given number of worker
+    processes and write the merged document to path
+
+    dedup_fields is applied within each address map (fragment)
+
+    page_template decorates the first page, the TOC and the merged pages
+    (the fragments have no decorations)
+
+    Returns the ids of the jobs which were rendered (not taken from the cache)
+    """
+
+    try:
+        from pypdf import PdfReader, PdfWriter # pylint: disable=import-outside-toplevel
+    except ImportError as err:
+        raise ImportError("Parallel export (workers > 1) requires the pypdf package") from err
+
+    # Content hash of each job. Identical jobs are told apart by their
+    # occurrence count, which keeps their bookmark keys unique
+    digests = []
+    occurrences = {}
+    for root_id, addrmap in jobs:
+        digest = get_digest(__version__, root_id, addrmap, dedup_fields)
+        count = occurrences.get(digest, 0)
+        occurrences[digest] = count + 1
+        digests.append(get_digest(digest, count))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fragment_paths = []
+        results = []
+        rendered = []
+        for job_id, digest in enumerate(digests):
+            cached = cache.get(digest) if cache is not None else None
+
+            if cached is not None:
+                fragment_paths.append(cache.get_path(digest))
+                results.append(cached)
+            else:
+                fragment_paths.append(os.path.join(tmp_dir, "fragment_%d.pdf" % job_id))
+                results.append(None)
+                rendered.append(job_id)
+
+        # Render the fragments
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for job_id in rendered:
+                root_id, addrmap = jobs[job_id]
+                key_prefix = "f%s-" % digests[job_id][:16]
+                futures[job_id] = executor.submit(render_fragment, addrmap, root_id,
+                                                  key_prefix, fragment_paths[job_id],
+                                                  dedup_fields)
+
+            for job_id, future in futures.items():
+                results[job_id] = future.result()
+
+        if cache is not None:
+            for job_id in rendered:
+                page_count, toc_entries = results[job_id]
+                cache.put(digests[job_id], fragment_paths[job_id], page_count, toc_entries)
+
+        # Build the first page and the TOC. The TOC length decides where the
+        # fragments start, so rebuild until the number of pages is stable
+        body_pages = sum(page_count for page_count, fragment_entries in results)
+        front_path = os.path.join(tmp_dir, "front.pdf")
+        front_pages = 0
+        while True:
+            toc_entries = []
+            page_offset = front_pages
+            for page_count, fragment_entries in results:
+                for level, text, page, key in fragment_entries:
+                    toc_entries.append((level, text, page + page_offset, key))
+                page_offset += page_count
+
+            front_creator = PDFCreator(front_path, page_template=page_template)
+            pages = front_creator.build_front_matter(toc_entries, front_pages, body_pages)
+            if pages == front_pages:
+                break
+            front_pages = pages
+
+        # Page decorations of all the pages (only used after the front matter)
+        total_pages = front_pages + body_pages
+        decorations_path = os.path.join(tmp_dir, "decorations.pdf")
+        create_page_decorations(decorations_path, total_pages, page_template)
+
+        # Merge everything together, the fragments go after the placeholder pages
+        writer = PdfWriter()
+        writer.append(front_path)
+        for fragment_path in fragment_paths:
+            writer.append(fragment_path)
+
+        # Point the TOC links from the placeholder pages to the fragment pages
+        placeholders = {}
+        for page_id in range(front_pages, total_pages):
+            placeholders[writer.pages[page_id].indirect_reference.idnum] = page_id + body_pages
+
+        for page_id in range(front_pages):
+            for annot in writer.pages[page_id].get("/Annots", []):
+                dest = annot.get_object().get("/Dest")
+                if dest is not None and dest[0].idnum in placeholders:
+                    dest[0] = writer.pages[placeholders[dest[0].idnum]].indirect_reference
+
+        for page_id in reversed(range(front_pages, total_pages)):
+            writer.remove_page(page_id)
+
+        # Page numbers, header and footer of the body pages
+        decorations = PdfReader(decorations_path)
+        for page_id in range(front_pages, total_pages):
+            writer.pages[page_id].merge_page(decorations.pages[page_id], over=False)
+            writer.pages[page_id].compress_content_streams()
+
+        # Drop the objects of the placeholder pages and the duplicated
+        # resources (fonts, images) of the fragments
+        writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+
+        writer.write(path)
+
+    if cache is not None:
+        cache.evict()
+
+    return rendered
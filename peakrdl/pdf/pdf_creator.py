@@ -1,3 +1,5 @@
+import time
+
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4, inch, mm
 from reportlab.platypus import Image, Paragraph, PageBreak, Table, Spacer
@@ -8,10 +10,13 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.lib.fonts import tt2ps
 from reportlab.rl_config import defaultPageSize
 from reportlab.platypus.doctemplate import SimpleDocTemplate
+from reportlab.platypus.flowables import Flowable
 from reportlab.lib.units import cm
 from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
-from ...examples import myFirstPage, myLaterPages
+from .page_template import PageTemplate
+from .instrumentation import get_traced_memory, get_memory_delta, add_memory
 
 from reportlab.rl_config import canvas_basefontname as _baseFontName, \
                                 underlineWidth as _baseUnderlineWidth, \
@@ -29,6 +34,9 @@ from reportlab.rl_config import canvas_basefontname as _baseFontName, \
 
 PAGE_HEIGHT=defaultPageSize[1]; PAGE_WIDTH=defaultPageSize[0]
 
+# Default left/right padding of the table cells
+CELL_PADDING = 6
+
 _baseFontNameB = tt2ps(_baseFontName,1,0)
 _baseFontNameI = tt2ps(_baseFontName,0,1)
 _baseFontNameBI = tt2ps(_baseFontName,1,1)
@@ -39,6 +47,51 @@ _baseFontNameBI = tt2ps(_baseFontName,1,1)
 ############################################################################
 class MySimpleDocTemplate(SimpleDocTemplate):
 
+    # Prefix for the bookmark keys, makes the keys unique
+    # when documents are merged together
+    key_prefix = ''
+
+    def beforeDocument(self):
+        # TOC entries registered during the (last) build
+        self.toc_entries = []
+
+        # Address map section being laid out (None - before the first one)
+        self.current_section = None
+        self.section_start = time.time()
+        self.section_start_memory = get_traced_memory()
+
+    def build(self, flowables, **kwargs):
+        # Record the duration (and the traced memory) of each layout pass
+        # (multiBuild calls build once per pass)
+        kwargs.setdefault('canvasmaker', self.make_canvas)
+        start_time = time.time()
+        start_memory = get_traced_memory()
+        SimpleDocTemplate.build(self, flowables, **kwargs)
+        self.pass_times.append(time.time() - start_time)
+        self.pass_memory.append(get_memory_delta(start_memory))
+
+    def make_canvas(self, *args, **kwargs):
+        c = TimedCanvas(*args, **kwargs)
+        c.timed_doc = self
+        return c
+
+    def end_section(self):
+        # Add the layout time (and traced memory) of the current address
+        # map section (summed over all the passes)
+        now = time.time()
+        self.section_times[self.current_section] = \
+            self.section_times.get(self.current_section, 0.0) + now - self.section_start
+        self.section_start = now
+
+        self.section_memory[self.current_section] = \
+            add_memory(self.section_memory.get(self.current_section),
+                       get_memory_delta(self.section_start_memory))
+        self.section_start_memory = get_traced_memory()
+
+    def _endBuild(self):
+        self.end_section()
+        SimpleDocTemplate._endBuild(self)
+
     # Used for registering the required items
     # into the table of contents
     def afterFlowable(self, flowable):
@@ -47,18 +100,275 @@ class MySimpleDocTemplate(SimpleDocTemplate):
             text = flowable.getPlainText()
             style = flowable.style.name
 
+            # The keys follow the order of the entries
+            # (see ReservedTableOfContents)
+            key = '%stoc-%d' % (self.key_prefix, len(self.toc_entries))
+
             if style == 'Header1P':
-                key = 'h1p-%s' % self.seq.nextf('Header1P')
+                # A new address map section starts
+                self.end_section()
+                self.current_section = text
+
                 self.canv.bookmarkPage(key, fit="FitH")
+                self.toc_entries.append((0, text, self.page, key))
                 self.notify('TOCEntry', (0, text, self.page, key))
 
             elif style == 'Header1PS':
                 # Pad spaces  
                 text = ' &nbsp;'*3 + text
-                key = 'h1ps-%s' % self.seq.nextf('Header1PS')
                 self.canv.bookmarkPage(key, fit="FitH")
+                self.toc_entries.append((1, text, self.page, key))
                 self.notify('TOCEntry', (1, text, self.page, key))
 
+############################################################################
+# Canvas which records the time (and traced memory) of writing the file
+# into its document template (the file is saved by build, multiBuild or
+# the single pass build)
+############################################################################
+class TimedCanvas(canvas.Canvas):
+
+    def save(self):
+        start_time = time.time()
+        start_memory = get_traced_memory()
+        canvas.Canvas.save(self)
+        self.timed_doc.write_time += time.time() - start_time
+        self.timed_doc.write_memory = add_memory(self.timed_doc.write_memory,
+                                                 get_memory_delta(start_memory))
+
+############################################################################
+# Table of contents with a fixed layout, built in a single pass
+#
+# The entries (one row each) are taken from the document before the build,
+# so the space of the TOC is known up front. Only the page numbers are
+# unknown while the TOC is drawn, they are referenced as forms which are
+# defined once the build is done (see define_page_numbers).
+#
+# Entry texts longer than the space before the page number are wrapped,
+# the dots and the page number follow the last line.
+############################################################################
+class ReservedTableOfContents(Flowable):
+
+    # Width reserved for the page numbers
+    page_number_width = 30
+
+    # Minimum width of the dots in between the text and the page number
+    min_dots_width = 20
+
+    # Indentation of each level
+    level_indent = 20
+
+    def __init__(self, levelStyles: list, rows: list = None):
+        Flowable.__init__(self)
+        self.levelStyles = levelStyles
+
+        # List of (entry id, level, text)
+        self.rows = rows or []
+
+        # Lines of the text of each row, for the width they were wrapped to
+        self.rows_lines = []
+        self.lines_width = None
+
+    def get_rows_lines(self, width: float) -> list:
+        if width != self.lines_width:
+            self.rows_lines = [self.get_lines(level, text, width)
+                               for entry_id, level, text in self.rows]
+            self.lines_width = width
+        return self.rows_lines
+
+    def get_lines(self, level: int, text: str, width: float) -> list:
+        """
+        Splits the text into the lines which fit before the dots
+        and the page number (long words are split too)
+        """
+        style = self.levelStyles[level]
+        max_width = width - self.page_number_width - self.min_dots_width - self.level_indent * level
+
+        def fits(line):
+            return stringWidth(line, style.fontName, style.fontSize) <= max_width
+
+        lines = []
+        line = ""
+        for word in text.split(" "):
+            candidate = line + " " + word if line else word
+            if fits(candidate):
+                line = candidate
+                continue
+
+            if line:
+                lines.append(line)
+            line = word
+
+            while not fits(line) and len(line) > 1:
+                cut = len(line) - 1
+                while cut > 1 and not fits(line[:cut]):
+                    cut -= 1
+                lines.append(line[:cut])
+                line = line[cut:]
+
+        lines.append(line)
+        return lines
+
+    def get_row_height(self, level: int, lines: int = 1) -> float:
+        style = self.levelStyles[level]
+        return style.spaceBefore + style.leading * lines
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = sum(self.get_row_height(level, len(lines))
+                          for (entry_id, level, text), lines in zip(self.rows, self.get_rows_lines(availWidth)))
+        return (self.width, self.height)
+
+    def split(self, availWidth, availHeight):
+        height = 0
+        for row_id, ((entry_id, level, text), lines) in enumerate(zip(self.rows, self.get_rows_lines(availWidth))):
+            height += self.get_row_height(level, len(lines))
+            if height > availHeight:
+                break
+        else:
+            return [self]
+
+        if row_id == 0:
+            return []
+
+        return [ReservedTableOfContents(self.levelStyles, self.rows[:row_id]),
+                ReservedTableOfContents(self.levelStyles, self.rows[row_id:])]
+
+    def draw(self):
+        key_prefix = self.canv._doctemplate.key_prefix
+        text_end = self.width - self.page_number_width
+        y = self.height
+
+        for (entry_id, level, text), lines in zip(self.rows, self.get_rows_lines(self.width)):
+            style = self.levelStyles[level]
+            row_height = self.get_row_height(level, len(lines))
+            y -= row_height
+
+            # Entry text (one baseline per line, top down) and the dots
+            indent = self.level_indent * level
+            self.canv.setFont(style.fontName, style.fontSize)
+            self.canv.setFillColor(style.textColor)
+            baseline = y + row_height - style.spaceBefore - style.fontSize
+            for line_id, line in enumerate(lines):
+                if line_id:
+                    baseline -= style.leading
+                self.canv.drawString(indent, baseline, line)
+
+            dots_start = indent + self.canv.stringWidth(lines[-1] + ' ', style.fontName, style.fontSize)
+            dot_width = self.canv.stringWidth(' . ', style.fontName, style.fontSize)
+            dots = ' . ' * max(int((text_end - dots_start) // dot_width), 0)
+            self.canv.drawRightString(text_end, baseline, dots)
+
+            # Page number (defined after the build)
+            self.canv.saveState()
+            self.canv.translate(self.width, baseline)
+            self.canv.doForm('TocPage%d' % entry_id)
+            self.canv.restoreState()
+
+            key = '%stoc-%d' % (key_prefix, entry_id)
+            self.canv.linkRect("", key, (0, y, self.width, y + row_height), relative=1)
+
+    def define_page_numbers(self, canv, toc_entries: list):
+        for entry_id, (level, text, page, key) in enumerate(toc_entries):
+            style = self.levelStyles[level]
+            canv.beginForm('TocPage%d' % entry_id, -self.page_number_width, -style.leading,
+                           0, style.leading)
+            canv.setFont(style.fontName, style.fontSize)
+            canv.setFillColor(style.textColor)
+            canv.drawRightString(0, 0, str(page))
+            canv.endForm()
+
+############################################################################
+# List-like source of flowables for the streaming build
+#
+# The flowables are pulled from an iterable only when the layout reaches
+# them, so only a few of them are alive at a time and the drawn ones can
+# be garbage collected. It supports the list operations used by the
+# reportlab build loop on the front of the list.
+############################################################################
+class FlowableStream:
+
+    # Number of flowables kept ahead of the layout (keepWithNext
+    # chains longer than this are not kept together)
+    lookahead = 2
+
+    def __init__(self, flowables):
+        self.flowables = iter(flowables)
+        self.buffer = []
+
+    def fill(self, count: int):
+        while len(self.buffer) < count:
+            try:
+                self.buffer.append(next(self.flowables))
+            except StopIteration:
+                break
+
+    def __len__(self):
+        self.fill(self.lookahead)
+        return len(self.buffer)
+
+    def fill_to_index(self, index):
+        if not isinstance(index, slice):
+            self.fill(index + 1)
+        elif index.stop is not None:
+            self.fill(index.stop)
+        else:
+            self.fill(self.lookahead)
+
+    def __getitem__(self, index):
+        self.fill_to_index(index)
+        return self.buffer[index]
+
+    def __setitem__(self, index, value):
+        self.buffer[index] = value
+
+    def __delitem__(self, index):
+        self.fill_to_index(index)
+        del self.buffer[index]
+
+    def insert(self, index: int, flowable):
+        self.buffer.insert(index, flowable)
+
+############################################################################
+# Zero size flowable which only registers bookmarks on the current page
+# (used for the placeholder pages of the front matter)
+############################################################################
+class BookmarksFlowable(Flowable):
+
+    def __init__(self, keys: list):
+        Flowable.__init__(self)
+        self.keys = keys
+
+    def wrap(self, availWidth, availHeight):
+        return (0, 0)
+
+    def draw(self):
+        for key in self.keys:
+            self.canv.bookmarkPage(key, fit="FitH")
+
+############################################################################
+# Page callback for the documents without decorations
+# (decorations are added separately, see create_page_decorations)
+############################################################################
+def noDecorationPage(canvas, doc):
+    pass
+
+############################################################################
+# Create a document with only the page decorations (header, footer and
+# page number) of the later pages, to be laid over the pages of a merged
+# document
+############################################################################
+def create_page_decorations(output_file, page_count: int, page_template: PageTemplate = None):
+    if page_template is None:
+        page_template = PageTemplate()
+
+    c = canvas.Canvas(output_file, pagesize=A4)
+
+    for page in range(page_count):
+        page_template.on_later_pages(c, None)
+        c.showPage()
+
+    c.save()
+
 ############################################################################
 # Main Pdf creater class with required properties
 # for creating the pdf contents and adding the data 
@@ -66,114 +376,202 @@ class MySimpleDocTemplate(SimpleDocTemplate):
 ############################################################################
 class PDFCreator:
 
+    # Column widths of the registers, fields and virtual registers tables
+    reg_list_col_widths = [120,120,200]
+    field_list_col_widths = [45,80,50,83,192]
+    vreg_list_col_widths = [90,100,120,90,50]
+    issue_list_col_widths = [70,180,200]
+
     def __init__(self, output_file: str, **kwargs):
         """
         Constructor for the PDF Creator class
+
+        fragment: bool
+            If True, the document has no first page and table of contents
+            and is meant to be merged into another document.
+
+        key_prefix: str
+            Prefix for the bookmark keys of the document
+
+        toc_mode: str
+            "multipass" (Default) - the TOC is resolved by laying out the
+            document until the page numbers are stable (multiBuild)
+
+            "single" - the TOC has a fixed layout, its page numbers are filled
+            in after a single layout pass
+
+        streaming: bool
+            If True, the flowables are laid out while they are created
+            (see build_document_stream) and the TOC goes after the body.
+            Only the "multipass" toc_mode is supported (laid out once).
+
+        page_template: PageTemplate
+            Decorations of the first page and of the later pages
+            (Default - PageTemplate())
+
+        stylesheet: StyleSheet1
+            Style sheet of an earlier document, shared instead of creating
+            a new one (Default - None, a new style sheet is created)
         """
 
+        self.fragment = kwargs.pop("fragment", False)
+        key_prefix = kwargs.pop("key_prefix", '')
+        self.toc_mode = kwargs.pop("toc_mode", "multipass")
+        self.streaming = kwargs.pop("streaming", False)
+        self.page_template = kwargs.pop("page_template", None)
+        stylesheet = kwargs.pop("stylesheet", None)
+
+        if self.page_template is None:
+            self.page_template = PageTemplate()
+
+        if self.toc_mode not in ("multipass", "single"):
+            raise ValueError("Not a valid toc_mode '%s'" % self.toc_mode)
+
+        if self.streaming and self.toc_mode != "multipass":
+            raise ValueError("toc_mode '%s' is not supported with streaming" % self.toc_mode)
+
         # Check for stray kwargs
         if kwargs:
             raise TypeError("got an unexpected keyword argument '%s'" % list(kwargs.keys())[0])
 
-        # Define variables used during creation
-        global doc, elements, styleSheet, doc_color
-        global table_data_reg_list, table_data_field_list, toc
+        # Define variables used during creation (all the state is kept
+        # in the instance, so multiple documents can be created concurrently)
+
+        # Create the document (invariant - no timestamp and document id
+        # in the file, the same content always gives the same bytes)
+        self.doc = MySimpleDocTemplate(output_file, pagesize=A4, invariant=1)
+        self.doc.key_prefix = key_prefix
 
-        # Create the document
-        doc = MySimpleDocTemplate(output_file, pagesize=A4)
+        # Duration of each layout pass of the build
+        self.doc.pass_times = []
+
+        # Layout time of each address map section (by its title, None for
+        # the pages before the first one) and the time of writing the file
+        self.doc.section_times = {}
+        self.doc.write_time = 0.0
+
+        # Traced memory of the same (None if tracemalloc is not tracing)
+        self.doc.pass_memory = []
+        self.doc.section_memory = {}
+        self.doc.write_memory = None
 
         # container for the 'Flowable' objects
-        elements = []
+        self.elements = []
 
         ## Table data
-        table_data_reg_list = []
-        table_data_field_list = []
+        self.table_data_reg_list = []
+        self.table_data_field_list = []
+        self.table_data_vreg_list = []
+
+        # Whether the first row of table_data_reg_list is the header
+        self.reg_list_has_header = False
+
+        # Maximum number of rows of a register list table, longer lists
+        # are split into multiple tables (None - no limit)
+        self.max_table_rows = None
 
         # Document color
-        #doc_color = darkgrey
-        #doc_color = dimgrey
-        #doc_color = black
-        doc_color  = colors.HexColor(0x24001e)
+        #self.doc_color = darkgrey
+        #self.doc_color = dimgrey
+        #self.doc_color = black
+        self.doc_color  = colors.HexColor(0x24001e)
+
+        # Create the style sheet (the styles are never modified,
+        # so the style sheet can be shared by the documents)
+        if stylesheet is not None:
+            self.styleSheet = stylesheet
+        else:
+            self.styleSheet = getSampleStyleSheet()
 
-        # Create the style sheet
-        styleSheet = getSampleStyleSheet()
+            # Add more custom styles
+            self.add_more_styles()
 
-        # Add more custom styles
-        self.add_more_styles()
+        if self.fragment:
+            return
 
         # First page
-        elements.append(PageBreak())
+        self.elements.append(PageBreak())
 
         # TOC
         h1 = ParagraphStyle(name = 'Heading1',
                             fontName=_baseFontNameB,
-                            textColor=doc_color,
+                            textColor=self.doc_color,
                             fontSize = 14,
                             spaceBefore=10,
                             leading = 16)
 
         h2 = ParagraphStyle(name = 'Heading2',
                             fontName=_baseFontName,
-                            textColor=doc_color,
+                            textColor=self.doc_color,
                             fontSize = 12,
                             leading = 14)
 
         # Table of contents 
-        toc = TableOfContents()
-        toc.levelStyles = [h1, h2]
+        if self.toc_mode == "single":
+            self.toc = ReservedTableOfContents([h1, h2])
+        else:
+            self.toc = TableOfContents()
+            self.toc.levelStyles = [h1, h2]
 
-        elements.append(Paragraph('Table of Contents', styleSheet["Header1Toc"]))
-        elements.append(Spacer(1, 1*inch))
-        elements.append(toc)
-        elements.append(PageBreak())
+        if self.streaming:
+            # Keep the flowables of a huge register list short lived
+            self.max_table_rows = 50
+
+            # The TOC is added after the body (see stream_flowables)
+            return
+
+        self.elements.append(Paragraph('Table of Contents', self.styleSheet["Header1Toc"]))
+        self.elements.append(Spacer(1, 1*inch))
+        self.elements.append(self.toc)
+        self.elements.append(PageBreak())
 
     ############################################################################
     # Creating the style sheet Template
     ############################################################################
     def add_more_styles(self):
 
-        styleSheet.add(ParagraphStyle(name='Header1P',
-                                      fontName=_baseFontNameB,
-                                      textColor=doc_color,
-                                      fontSize=30,
-                                      leading=12),
-                       alias='H1p')
+        self.styleSheet.add(ParagraphStyle(name='Header1P',
+                                           fontName=_baseFontNameB,
+                                           textColor=self.doc_color,
+                                           fontSize=30,
+                                           leading=12),
+                            alias='H1p')
         
-        styleSheet.add(ParagraphStyle(name='Header1PS',
-                                      fontName=_baseFontNameB,
-                                      textColor=doc_color,
-                                      fontSize=26,
-                                      leading=12),
-                       alias='H1pS')
-
-        styleSheet.add(ParagraphStyle(name='Header1Toc',
-                                      fontName=_baseFontNameB,
-                                      textColor=doc_color,
-                                      fontSize=30,
-                                      leading=12),
-                       alias='H1t')
-
-        styleSheet.add(ParagraphStyle(name='Header2P',
-                                      fontName=_baseFontNameB,
-                                      textColor=doc_color,
-                                      fontSize=20,
-                                      leading=12),
-                       alias='H2p')
-
-        styleSheet.add(ParagraphStyle(name='BodyTextP',
-                                      fontName=_baseFontName,
-                                      textColor=doc_color,
-                                      fontSize=10,
-                                      leading=12),
-                       alias='BTP')
-
-        styleSheet.add(ParagraphStyle(name='BodyTextT',
-                                      fontName=_baseFontName,
-                                      textColor=doc_color,
-                                      #alignment=TA_CENTER,
-                                      fontSize=10,
-                                      leading=12),
-                       alias='BTT')
+        self.styleSheet.add(ParagraphStyle(name='Header1PS',
+                                           fontName=_baseFontNameB,
+                                           textColor=self.doc_color,
+                                           fontSize=26,
+                                           leading=12),
+                            alias='H1pS')
+
+        self.styleSheet.add(ParagraphStyle(name='Header1Toc',
+                                           fontName=_baseFontNameB,
+                                           textColor=self.doc_color,
+                                           fontSize=30,
+                                           leading=12),
+                            alias='H1t')
+
+        self.styleSheet.add(ParagraphStyle(name='Header2P',
+                                           fontName=_baseFontNameB,
+                                           textColor=self.doc_color,
+                                           fontSize=20,
+                                           leading=12),
+                            alias='H2p')
+
+        self.styleSheet.add(ParagraphStyle(name='BodyTextP',
+                                           fontName=_baseFontName,
+                                           textColor=self.doc_color,
+                                           fontSize=10,
+                                           leading=12),
+                            alias='BTP')
+
+        self.styleSheet.add(ParagraphStyle(name='BodyTextT',
+                                           fontName=_baseFontName,
+                                           textColor=self.doc_color,
+                                           #alignment=TA_CENTER,
+                                           fontSize=10,
+                                           leading=12),
+                            alias='BTT')
 
         return
 
@@ -181,7 +579,135 @@ class PDFCreator:
     # Build the document and write it to the disk 
     ############################################################################
     def build_document(self):
-        doc.multiBuild(elements, onFirstPage=myFirstPage, onLaterPages=myLaterPages)
+        if self.toc_mode == "single":
+            self.build_document_single_pass()
+        else:
+            self.doc.multiBuild(self.elements, onFirstPage=self.page_template.on_first_page,
+                                onLaterPages=self.page_template.on_later_pages)
+
+    ############################################################################
+    # Build the document with a single layout pass (fixed layout TOC)
+    ############################################################################
+    def build_document_single_pass(self):
+        # The TOC rows, in the same order as the entries
+        # registered by MySimpleDocTemplate.afterFlowable
+        rows = []
+        for flowable in self.elements:
+            if isinstance(flowable, Paragraph):
+                if flowable.style.name == 'Header1P':
+                    rows.append((len(rows), 0, flowable.getPlainText()))
+                elif flowable.style.name == 'Header1PS':
+                    rows.append((len(rows), 1, flowable.getPlainText()))
+        self.toc.rows = rows
+
+        # Save only after the page numbers are defined
+        self.doc._doSave = 0
+        self.doc.build(self.elements, onFirstPage=self.page_template.on_first_page,
+                       onLaterPages=self.page_template.on_later_pages)
+        self.toc.define_page_numbers(self.doc.canv, self.doc.toc_entries)
+        self.doc.canv.save()
+
+    ############################################################################
+    # Build the document while the flowables are created
+    #
+    # Each step of the chunks iterable adds flowables into self.elements,
+    # which are laid out (and released) before the next step is taken.
+    ############################################################################
+    def build_document_stream(self, chunks):
+        self.doc.build(FlowableStream(self.stream_flowables(chunks)),
+                       onFirstPage=self.page_template.on_first_page,
+                       onLaterPages=self.page_template.on_later_pages)
+
+    def stream_flowables(self, chunks):
+        # First page
+        yield from self.take_elements()
+
+        for chunk in chunks:
+            yield from self.take_elements()
+
+        # The page numbers of all the TOC entries are known by now
+        for entry in self.doc.toc_entries:
+            self.toc.addEntry(*entry)
+        self.toc.beforeBuild()
+
+        yield Paragraph('Table of Contents', self.styleSheet["Header1Toc"])
+        yield Spacer(1, 1*inch)
+        yield self.toc
+
+    def take_elements(self) -> list:
+        elements = self.elements
+        self.elements = []
+        return elements
+
+    ############################################################################
+    # Returns the duration of each layout pass of the last build
+    ############################################################################
+    def get_pass_times(self) -> list:
+        return self.doc.pass_times
+
+    ############################################################################
+    # Returns the layout time of each address map section (by its title)
+    ############################################################################
+    def get_section_times(self) -> dict:
+        return self.doc.section_times
+
+    ############################################################################
+    # Returns the time of writing the file
+    ############################################################################
+    def get_write_time(self) -> float:
+        return self.doc.write_time
+
+    ############################################################################
+    # Returns the traced memory of each layout pass, of each address map
+    # section and of writing the file (None if it was not traced)
+    ############################################################################
+    def get_pass_memory(self) -> list:
+        return self.doc.pass_memory
+
+    def get_section_memory(self) -> dict:
+        return self.doc.section_memory
+
+    def get_write_memory(self) -> int:
+        return self.doc.write_memory
+
+    ############################################################################
+    # Build the fragment document (single pass, without page decorations)
+    # Returns the number of pages and the TOC entries of the fragment
+    ############################################################################
+    def build_fragment(self) -> tuple:
+        self.doc.build(self.elements, onFirstPage=noDecorationPage, onLaterPages=noDecorationPage)
+        return (self.doc.page, self.doc.toc_entries)
+
+    ############################################################################
+    # Build the first page and the TOC with the already known entries
+    #
+    # The TOC entries link to body pages which are not part of this document,
+    # so one placeholder page is added per body page and carries the bookmarks
+    # of that page. The placeholder pages are replaced after the merge.
+    # Returns the number of pages without the placeholder pages
+    ############################################################################
+    def build_front_matter(self, toc_entries: list, front_pages: int, body_pages: int) -> int:
+        self.toc.clearEntries()
+        for entry in toc_entries:
+            self.toc.addEntry(*entry)
+
+        # Make the entries visible to the (single) build
+        self.toc.beforeBuild()
+
+        # Bookmark keys of each body page (by the body page index)
+        page_keys = [[] for page in range(body_pages)]
+        for level, text, page, key in toc_entries:
+            page_keys[page - front_pages - 1].append(key)
+
+        placeholders = []
+        for keys in page_keys:
+            placeholders.append(BookmarksFlowable(keys))
+            placeholders.append(PageBreak())
+
+        self.doc.build(self.elements + placeholders,
+                       onFirstPage=self.page_template.on_first_page,
+                       onLaterPages=self.page_template.on_later_pages)
+        return self.doc.page - body_pages
 
     ############################################################################
     # Create the address map information
@@ -189,34 +715,35 @@ class PDFCreator:
     def create_addrmap_info(self, map_info_dict: dict):
         for key in map_info_dict:
             if key == "Name":
-                elements.append(Paragraph(map_info_dict[key], styleSheet["H1p"]))
-                elements.append(Spacer(0, 0.5*inch))
+                self.elements.append(Paragraph(map_info_dict[key], self.styleSheet["H1p"]))
+                self.elements.append(Spacer(0, 0.5*inch))
             elif key == "Desc":
-                elements.append(Paragraph(map_info_dict[key], styleSheet["BodyTextP"]))
-                elements.append(Spacer(0, 0.2*inch))
+                self.elements.append(Paragraph(map_info_dict[key], self.styleSheet["BodyTextP"]))
+                self.elements.append(Spacer(0, 0.2*inch))
             elif key == "Base_address":
-                elements.append(Paragraph(('<b>Base Address: </b>' + map_info_dict[key]), 
-                                    styleSheet["BodyTextP"]))
+                self.elements.append(Paragraph(('<b>Base Address: </b>' + map_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
             elif key == "Size":
-                elements.append(Paragraph(('<b>Size(bytes): </b>' + map_info_dict[key]), 
-                                    styleSheet["BodyTextP"]))
-                elements.append(Spacer(0, 0.2*inch))
+                self.elements.append(Paragraph(('<b>Size(bytes): </b>' + map_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
+                self.elements.append(Spacer(0, 0.2*inch))
             else:
                 print("Error - Not a valid key for the addrmap")
 
         # Add the Register list
-        elements.append(Paragraph('Registers List', styleSheet["H2p"]))
-        elements.append(Spacer(0, 0.4*inch))
+        self.elements.append(Paragraph('Registers List', self.styleSheet["H2p"]))
+        self.elements.append(Spacer(0, 0.4*inch))
 
         ## Actual Header data
-        P_offset_header = Paragraph('<b>Offset</b>',styleSheet["BodyTextT"])    
-        P_identifier_header = Paragraph('<b>Identifier</b>',styleSheet["BodyTextT"])    
-        P_name_header = Paragraph('<b>Name</b>',styleSheet["BodyTextT"])    
+        P_offset_header = Paragraph('<b>Offset</b>',self.styleSheet["BodyTextT"])    
+        P_identifier_header = Paragraph('<b>Identifier</b>',self.styleSheet["BodyTextT"])    
+        P_name_header = Paragraph('<b>Name</b>',self.styleSheet["BodyTextT"])    
 
         # Clear any previous values
-        table_data_reg_list.clear()
+        self.table_data_reg_list.clear()
 
-        table_data_reg_list.append([P_offset_header, P_identifier_header, P_name_header])
+        self.table_data_reg_list.append([P_offset_header, P_identifier_header, P_name_header])
+        self.reg_list_has_header = True
 
     ############################################################################
     # Create the register information  
@@ -226,54 +753,194 @@ class PDFCreator:
             if key == "Name":
                 tag_id = "<a name=\"" +  (reg_info_dict[key]).replace(" ","") + "\"/>"
                 dummy = "" # done so that the jump doesn't mask the required data
-                elements.append(Paragraph((tag_id + dummy), styleSheet["BodyTextP"]))
-                elements.append(Paragraph(reg_info_dict[key], styleSheet["H1pS"]))
-                elements.append(Spacer(0, 0.5*inch))
+                self.elements.append(Paragraph((tag_id + dummy), self.styleSheet["BodyTextP"]))
+                self.elements.append(Paragraph(reg_info_dict[key], self.styleSheet["H1pS"]))
+                self.elements.append(Spacer(0, 0.5*inch))
             elif key == "Desc1":
-                elements.append(Paragraph(reg_info_dict[key], styleSheet["BodyTextP"]))
-                elements.append(Spacer(0, 0.2*inch))
+                self.elements.append(Paragraph(reg_info_dict[key], self.styleSheet["BodyTextP"]))
+                self.elements.append(Spacer(0, 0.2*inch))
             elif key == "Desc2":
-                elements.append(Paragraph(reg_info_dict[key], styleSheet["BodyTextP"]))
-                elements.append(Spacer(0, 0.2*inch))
+                self.elements.append(Paragraph(reg_info_dict[key], self.styleSheet["BodyTextP"]))
+                self.elements.append(Spacer(0, 0.2*inch))
             elif key == "Absolute_address":
-                elements.append(Paragraph(('<b>Absolute Address: </b>' + ('&nbsp;')*2 + reg_info_dict[key]), 
-                                    styleSheet["BodyTextP"]))
+                self.elements.append(Paragraph(('<b>Absolute Address: </b>' + ('&nbsp;')*2 + reg_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
             elif key == "Base_offset":
-                elements.append(Paragraph(('<b>Base Offset: </b>' + ('&nbsp;')*13 + reg_info_dict[key]), 
-                                    styleSheet["BodyTextP"]))
+                self.elements.append(Paragraph(('<b>Base Offset: </b>' + ('&nbsp;')*13 + reg_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
             elif key == "Reset":
-                elements.append(Paragraph(('<b>Reset: </b>' + ('&nbsp;')*23 + reg_info_dict[key]), 
-                                    styleSheet["BodyTextP"]))
+                self.elements.append(Paragraph(('<b>Reset: </b>' + ('&nbsp;')*23 + reg_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
             elif key == "Access":
-                elements.append(Paragraph(('<b>Access: </b>' + ('&nbsp;')*20 + reg_info_dict[key]), 
-                                    styleSheet["BodyTextP"]))
+                self.elements.append(Paragraph(('<b>Access: </b>' + ('&nbsp;')*20 + reg_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
             elif key == "Size":
-                elements.append(Paragraph(('<b>Size(bytes): </b>' + ('&nbsp;')*14 + reg_info_dict[key]), 
-                                    styleSheet["BodyTextP"]))
-                elements.append(Spacer(0, 0.2*inch))
+                self.elements.append(Paragraph(('<b>Size(bytes): </b>' + ('&nbsp;')*14 + reg_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
+                self.elements.append(Spacer(0, 0.2*inch))
             else:
                 print("Error - Not a valid key (%s) for the register" %key)
 
         # Add the Fields list
-        elements.append(Paragraph('Fields List', styleSheet["H2p"]))
-        elements.append(Spacer(0, 0.4*inch))
+        self.elements.append(Paragraph('Fields List', self.styleSheet["H2p"]))
+        self.elements.append(Spacer(0, 0.4*inch))
 
         ## Actual Header data
-        P_offset_header     = Paragraph('<b>Bits</b>',styleSheet["BodyTextT"])    
-        P_identifier_header = Paragraph('<b>Identifier</b>',styleSheet["BodyTextT"])    
-        P_access_header     = Paragraph('<b>Access</b>',styleSheet["BodyTextT"])    
-        P_reset_header      = Paragraph('<b>Reset</b>',styleSheet["BodyTextT"])    
-        P_name_header       = Paragraph('<b>Name / Description </b>',styleSheet["BodyTextT"])    
+        P_offset_header     = Paragraph('<b>Bits</b>',self.styleSheet["BodyTextT"])    
+        P_identifier_header = Paragraph('<b>Identifier</b>',self.styleSheet["BodyTextT"])    
+        P_access_header     = Paragraph('<b>Access</b>',self.styleSheet["BodyTextT"])    
+        P_reset_header      = Paragraph('<b>Reset</b>',self.styleSheet["BodyTextT"])    
+        P_name_header       = Paragraph('<b>Name / Description </b>',self.styleSheet["BodyTextT"])    
 
 
         # Clear any previous values
-        table_data_field_list.clear()
+        self.table_data_field_list.clear()
+
+        self.table_data_field_list.append([P_offset_header, 
+                                           P_identifier_header, 
+                                           P_access_header, 
+                                           P_reset_header,
+                                           P_name_header])
+
+    ############################################################################
+    # Create the memory information (summary of the memory)
+    ############################################################################
+    def create_memory_info(self, mem_info_dict: dict):
+        for key in mem_info_dict:
+            if key == "Name":
+                tag_id = "<a name=\"" +  (mem_info_dict[key]).replace(" ","") + "\"/>"
+                dummy = "" # done so that the jump doesn't mask the required data
+                self.elements.append(Paragraph((tag_id + dummy), self.styleSheet["BodyTextP"]))
+                self.elements.append(Paragraph(mem_info_dict[key], self.styleSheet["H1pS"]))
+                self.elements.append(Spacer(0, 0.5*inch))
+            elif key == "Desc1":
+                self.elements.append(Paragraph(mem_info_dict[key], self.styleSheet["BodyTextP"]))
+                self.elements.append(Spacer(0, 0.2*inch))
+            elif key == "Desc2":
+                self.elements.append(Paragraph(mem_info_dict[key], self.styleSheet["BodyTextP"]))
+                self.elements.append(Spacer(0, 0.2*inch))
+            elif key == "Absolute_address":
+                self.elements.append(Paragraph(('<b>Absolute Address: </b>' + ('&nbsp;')*2 + mem_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
+            elif key == "Base_offset":
+                self.elements.append(Paragraph(('<b>Base Offset: </b>' + ('&nbsp;')*13 + mem_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
+            elif key == "Size":
+                self.elements.append(Paragraph(('<b>Size(bytes): </b>' + ('&nbsp;')*14 + mem_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
+            elif key == "Entries":
+                self.elements.append(Paragraph(('<b>Entries: </b>' + ('&nbsp;')*20 + mem_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
+            elif key == "Width":
+                self.elements.append(Paragraph(('<b>Width(bits): </b>' + ('&nbsp;')*14 + mem_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
+            elif key == "Access":
+                self.elements.append(Paragraph(('<b>Access: </b>' + ('&nbsp;')*20 + mem_info_dict[key]), 
+                                    self.styleSheet["BodyTextP"]))
+                self.elements.append(Spacer(0, 0.2*inch))
+            else:
+                print("Error - Not a valid key (%s) for the memory" %key)
+
+        # Add the Virtual Registers list
+        self.elements.append(Paragraph('Virtual Registers List', self.styleSheet["H2p"]))
+        self.elements.append(Spacer(0, 0.4*inch))
+
+        ## Actual Header data
+        P_offset_header     = Paragraph('<b>Offset</b>',self.styleSheet["BodyTextT"])
+        P_identifier_header = Paragraph('<b>Identifier</b>',self.styleSheet["BodyTextT"])
+        P_name_header       = Paragraph('<b>Name</b>',self.styleSheet["BodyTextT"])
+        P_reset_header      = Paragraph('<b>Reset</b>',self.styleSheet["BodyTextT"])
+        P_access_header     = Paragraph('<b>Access</b>',self.styleSheet["BodyTextT"])
+
+        # Clear any previous values
+        self.table_data_vreg_list.clear()
+
+        self.table_data_vreg_list.append([P_offset_header,
+                                          P_identifier_header,
+                                          P_name_header,
+                                          P_reset_header,
+                                          P_access_header])
+
+    ############################################################################
+    # Create the title of an appendix
+    ############################################################################
+    def create_appendix_info(self, title: str):
+        self.elements.append(Paragraph(title, self.styleSheet["H1p"]))
+        self.elements.append(Spacer(0, 0.5*inch))
+
+    ############################################################################
+    # Create the address check of an address map: a table of its issues
+    # (holes, overlaps and misaligned entries)
+    ############################################################################
+    def create_address_check_info(self, title: str, issue_rows: list):
+        self.elements.append(Paragraph(title, self.styleSheet["H1pS"]))
+        self.elements.append(Spacer(0, 0.4*inch))
+
+        if not issue_rows:
+            self.elements.append(Paragraph('No holes, overlaps or misaligned entries',
+                                           self.styleSheet["BodyTextP"]))
+            self.elements.append(Spacer(0, 0.4*inch))
+            return
+
+        ## Actual Header data
+        P_kind_header    = Paragraph('<b>Kind</b>',self.styleSheet["BodyTextT"])
+        P_range_header   = Paragraph('<b>Range</b>',self.styleSheet["BodyTextT"])
+        P_entries_header = Paragraph('<b>Entries</b>',self.styleSheet["BodyTextT"])
+
+        table_data = [[P_kind_header, P_range_header, P_entries_header]]
+
+        for issue_dict in issue_rows:
+            P_kind    = self.create_value_cell(issue_dict['Kind'], self.issue_list_col_widths[0])
+            P_range   = Paragraph(issue_dict['Range'],self.styleSheet["BodyTextP"])
+            P_entries = Paragraph(issue_dict['Entries'],self.styleSheet["BodyTextP"])
+            table_data.append([P_kind, P_range, P_entries])
+
+        t=Table(table_data,
+                colWidths=self.issue_list_col_widths,
+                splitByRow=1,
+                repeatRows=1,
+                style=self.get_value_cell_style() + [
+                    ('GRID',(0,0),(-1,-1),0.5,self.doc_color),
+                    ('LINEABOVE',(0,1),(-1,1),1,colors.black),
+                    ('BACKGROUND',(0,0),(-1,0),colors.HexColor(0xD9D9D9)),
+                    ])
+
+        self.elements.append(t)
+        self.elements.append(Spacer(0, 0.4*inch))
+
+    ############################################################################
+    # End of an appendix
+    ############################################################################
+    def dump_appendix_info(self):
+
+        # Page break
+        self.elements.append(PageBreak())
+
+    ############################################################################
+    # Create a table cell for a short fixed-format value
+    #
+    # A plain string is drawn by the table itself (no markup parsing and no
+    # wrapping), values with markup or too wide for the column fall back to
+    # a Paragraph
+    ############################################################################
+    def create_value_cell(self, text: str, col_width: float):
+        style = self.styleSheet["BodyTextP"]
+
+        if ('<' in text) or ('&' in text) or \
+           (stringWidth(text, style.fontName, style.fontSize) > col_width - 2*CELL_PADDING):
+            return Paragraph(text, style)
+
+        return text
+
+    ############################################################################
+    # Table style commands for drawing the plain string cells
+    # like the BodyTextP paragraphs
+    ############################################################################
+    def get_value_cell_style(self) -> list:
+        style = self.styleSheet["BodyTextP"]
 
-        table_data_field_list.append([P_offset_header, 
-                                      P_identifier_header, 
-                                      P_access_header, 
-                                      P_reset_header,
-                                      P_name_header])
+        return [('FONT',(0,0),(-1,-1),style.fontName,style.fontSize,style.leading),
+                ('TEXTCOLOR',(0,0),(-1,-1),style.textColor)]
 
     ############################################################################
     # Create the register's list info
@@ -281,80 +948,154 @@ class PDFCreator:
     def create_reg_list_info(self, reg_info_dict: dict, is_reserved: bool):
 
         # Offset
-        P_offset = Paragraph(reg_info_dict['Offset'],styleSheet["BodyTextP"])    
+        P_offset = self.create_value_cell(reg_info_dict['Offset'], self.reg_list_col_widths[0])
 
         # Identifier
         if is_reserved:
-            P_identifier = Paragraph(reg_info_dict['Identifier'],styleSheet["BodyTextP"])    
+            P_identifier = Paragraph(reg_info_dict['Identifier'],self.styleSheet["BodyTextP"])    
         else:
             # <a href="#ID" color="blue"> Text </a>
             link = '<a href="#%s" color="blue">' % (reg_info_dict['Id'] + (reg_info_dict['Name']).replace(" ",""))
-            P_identifier = Paragraph((link + reg_info_dict['Identifier'] + "</a>"),styleSheet["BodyTextP"])    
+            P_identifier = Paragraph((link + reg_info_dict['Identifier'] + "</a>"),self.styleSheet["BodyTextP"])    
 
         # Name
-        P_name = Paragraph(reg_info_dict['Name'],styleSheet["BodyTextP"])    
+        P_name = Paragraph(reg_info_dict['Name'],self.styleSheet["BodyTextP"])    
 
-        table_data_reg_list.append([P_offset, P_identifier, P_name])
+        self.table_data_reg_list.append([P_offset, P_identifier, P_name])
+
+        if self.max_table_rows is not None and len(self.table_data_reg_list) >= self.max_table_rows:
+            self.flush_reg_list_info()
 
     ############################################################################
     # Create the field's list info 
     ############################################################################
     def create_fields_list_info(self, field_info_dict: dict):
 
-        P_bits       = Paragraph(field_info_dict['Bits'],styleSheet["BodyTextP"])    
-        P_identifier = Paragraph(field_info_dict['Identifier'],styleSheet["BodyTextP"])    
-        P_access     = Paragraph(field_info_dict['Access'],styleSheet["BodyTextP"])    
-        P_reset      = Paragraph(field_info_dict['Reset'],styleSheet["BodyTextP"])    
-        P_name       = Paragraph(field_info_dict['Name'],styleSheet["BodyTextP"])    
-        P_desc       = Paragraph(field_info_dict['Description'],styleSheet["BodyTextP"])    
+        P_bits       = self.create_value_cell(field_info_dict['Bits'], self.field_list_col_widths[0])
+        P_identifier = Paragraph(field_info_dict['Identifier'],self.styleSheet["BodyTextP"])    
+        P_access     = self.create_value_cell(field_info_dict['Access'], self.field_list_col_widths[2])
+        P_reset      = self.create_value_cell(field_info_dict['Reset'], self.field_list_col_widths[3])
+        P_name       = Paragraph(field_info_dict['Name'],self.styleSheet["BodyTextP"])    
+        P_desc       = Paragraph(field_info_dict['Description'],self.styleSheet["BodyTextP"])    
 
-        table_data_field_list.append([P_bits, 
-                                      P_identifier, 
-                                      P_access,
-                                      P_reset,
-                                      [P_name,P_desc],
-                                      ])
+        self.table_data_field_list.append([P_bits, 
+                                           P_identifier, 
+                                           P_access,
+                                           P_reset,
+                                           [P_name,P_desc],
+                                           ])
+
+    ############################################################################
+    # Create the virtual register's list info (of a memory)
+    ############################################################################
+    def create_vregs_list_info(self, vreg_info_dict: dict):
+
+        P_offset     = self.create_value_cell(vreg_info_dict['Offset'], self.vreg_list_col_widths[0])
+        P_identifier = Paragraph(vreg_info_dict['Identifier'],self.styleSheet["BodyTextP"])
+        P_name       = Paragraph(vreg_info_dict['Name'],self.styleSheet["BodyTextP"])
+        P_reset      = self.create_value_cell(vreg_info_dict['Reset'], self.vreg_list_col_widths[3])
+        P_access     = self.create_value_cell(vreg_info_dict['Access'], self.vreg_list_col_widths[4])
+
+        self.table_data_vreg_list.append([P_offset, P_identifier, P_name, P_reset, P_access])
 
     ############################################################################
     # Used for dumping the registers table info into the pdf document 
     ############################################################################
     def dump_reg_list_info(self):
 
-        t=Table(table_data_reg_list,
-                colWidths=[120,120,200],
-                splitByRow=1,
-                repeatRows=1,
-                style=[
-                    ('GRID',(0,0),(-1,-1),0.5,doc_color),
-                    ('LINEABOVE',(0,1),(-1,1),1,colors.black),
-                    ('BACKGROUND',(0,0),(-1,0),colors.HexColor(0xD9D9D9))
-                    ])
-
-        elements.append(t)
-        #elements.append(Spacer(1, 1*inch))
+        self.flush_reg_list_info()
+        #self.elements.append(Spacer(1, 1*inch))
         
         # Page break
-        elements.append(PageBreak())
+        self.elements.append(PageBreak())
+
+    ############################################################################
+    # Add the collected rows of the registers table into the pdf document
+    # (the rows after a flush continue the table without a header)
+    ############################################################################
+    def flush_reg_list_info(self):
+
+        if not self.table_data_reg_list:
+            return
+
+        if self.reg_list_has_header:
+            t=Table(self.table_data_reg_list,
+                    colWidths=self.reg_list_col_widths,
+                    splitByRow=1,
+                    repeatRows=1,
+                    style=self.get_value_cell_style() + [
+                        ('GRID',(0,0),(-1,-1),0.5,self.doc_color),
+                        ('LINEABOVE',(0,1),(-1,1),1,colors.black),
+                        ('BACKGROUND',(0,0),(-1,0),colors.HexColor(0xD9D9D9))
+                        ])
+        else:
+            t=Table(self.table_data_reg_list,
+                    colWidths=self.reg_list_col_widths,
+                    splitByRow=1,
+                    style=self.get_value_cell_style() + [
+                        ('GRID',(0,0),(-1,-1),0.5,self.doc_color),
+                        ])
+
+        self.elements.append(t)
+
+        # Clear the added rows
+        self.table_data_reg_list = []
+        self.reg_list_has_header = False
 
     ############################################################################
     # Used for dumping the fields table info into the pdf document
     ############################################################################
     def dump_field_list_info(self):
 
-        t=Table(table_data_field_list,
-                colWidths=[45,80,50,83,192],
+        t=Table(self.table_data_field_list,
+                colWidths=self.field_list_col_widths,
                 splitByRow=1,
                 repeatRows=1,
-                style=[
-                    ('GRID',(0,0),(-1,-1),0.5,doc_color),
+                style=self.get_value_cell_style() + [
+                    ('GRID',(0,0),(-1,-1),0.5,self.doc_color),
                     ('LINEABOVE',(0,1),(-1,1),1,colors.black),
                     ('BACKGROUND',(0,0),(-1,0),colors.HexColor(0xD9D9D9)),
                     ('ALIGN',(0,0),(-1,-1),'LEFT'),
                     ('VALIGN',(0,1),(-1,-1),'MIDDLE'),
                     ])
 
-        elements.append(t)
-        #elements.append(Spacer(1, 1*inch))
+        self.elements.append(t)
+        #self.elements.append(Spacer(1, 1*inch))
+
+        # Page break
+        self.elements.append(PageBreak())
+
+    ############################################################################
+    # Used for dumping the virtual registers table info into the pdf document
+    ############################################################################
+    def dump_vregs_list_info(self):
+
+        if len(self.table_data_vreg_list) == 1:
+            # Only the header
+            self.elements.append(Paragraph('No virtual registers', self.styleSheet["BodyTextP"]))
+        else:
+            t=Table(self.table_data_vreg_list,
+                    colWidths=self.vreg_list_col_widths,
+                    splitByRow=1,
+                    repeatRows=1,
+                    style=self.get_value_cell_style() + [
+                        ('GRID',(0,0),(-1,-1),0.5,self.doc_color),
+                        ('LINEABOVE',(0,1),(-1,1),1,colors.black),
+                        ('BACKGROUND',(0,0),(-1,0),colors.HexColor(0xD9D9D9)),
+                        ])
+            self.elements.append(t)
+
+        # Page break
+        self.elements.append(PageBreak())
+
+    ############################################################################
+    # Used for referencing the fields table of another register
+    # (with the same layout) instead of dumping the fields table
+    ############################################################################
+    def dump_field_list_reference(self, title: str, anchor: str):
+
+        link = '<a href="#%s" color="blue">%s</a>' % (anchor, title)
+        self.elements.append(Paragraph('Same layout as ' + link, self.styleSheet["BodyTextP"]))
 
         # Page break
-        elements.append(PageBreak())
+        self.elements.append(PageBreak())
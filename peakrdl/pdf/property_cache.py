@@ -0,0 +1,78 @@
+from systemrdl.node import Node
+
+# Marks a property which is not set on the component
+_NOT_SET = object()
+
+############################################################################
+# Memoized property lookups
+#
+# Entries are keyed by the elaborated component (shared by all the
+# elements of an array) and the property name, so each property is read
+# from the systemrdl model only once per export.
+############################################################################
+class PropertyCache:
+
+    def __init__(self):
+        """
+        Constructor for the Property Cache class
+        """
+
+        # Dictionary of the user defined properties set on a component
+        # key = component
+        # value = set of the udp names
+        self.udp_db = {}
+
+        # Dictionary of the property values
+        # key = (component, property name)
+        # value = property value or _NOT_SET
+        self.value_db = {}
+
+        # Lookup statistics
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """
+        Invalidate all the entries (done at the start of each export)
+        """
+
+        self.udp_db.clear()
+        self.value_db.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def has_udp(self, prop_name: str, node: Node) -> bool:
+        """
+        Checks if the property name is a udp set on the node
+        """
+
+        udps = self.udp_db.get(node.inst)
+
+        if udps is None:
+            self.misses += 1
+            udps = frozenset(node.list_properties(include_native=False, include_udp=True))
+            self.udp_db[node.inst] = udps
+        else:
+            self.hits += 1
+
+        return prop_name in udps
+
+    def get_property(self, node: Node, prop_name: str, default=None):
+        """
+        Returns the property value of the node, or default if not set
+        """
+
+        key = (node.inst, prop_name)
+
+        if key in self.value_db:
+            self.hits += 1
+            value = self.value_db[key]
+        else:
+            self.misses += 1
+            value = node.get_property(prop_name, default=_NOT_SET)
+            self.value_db[key] = value
+
+        if value is _NOT_SET:
+            return default
+
+        return value
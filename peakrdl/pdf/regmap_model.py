@@ -0,0 +1,205 @@
+import hashlib
+
+############################################################################
+# Compact intermediate model of the register map
+#
+# The exporter extracts every address map once from the elaborated
+# systemrdl nodes into these records. Both the registers list and the
+# registers information sections are rendered from them, so the
+# systemrdl nodes are traversed (and their properties read) only once.
+############################################################################
+
+# Version of the records, changed whenever a record changes
+# (the cached models of another version are not used)
+MODEL_VERSION = 6
+
+class FieldInfo:
+    """
+    Data of a single field
+    """
+    __slots__ = ('inst_name', 'name', 'desc', 'msb', 'lsb', 'width',
+                 'reset', 'access')
+
+    def __init__(self, inst_name: str, name: str, desc: str, msb: int, lsb: int,
+                 width: int, reset: int, access: str):
+        self.inst_name = inst_name
+        self.name = name
+        self.desc = desc
+        self.msb = msb
+        self.lsb = lsb
+        self.width = width
+        self.reset = reset
+        self.access = access
+
+class RegisterInfo:
+    """
+    Data of a single register
+
+    fields are stored MSB first
+
+    array_dimensions and array_stride are only set for a (collapsed)
+    register array, address_offset is then the offset of its first element
+
+    type_name is the name of the original reg definition
+    (None for anonymous definitions)
+    """
+    __slots__ = ('inst_name', 'name', 'desc', 'address_offset', 'total_size',
+                 'width', 'reset', 'access', 'fields', 'array_dimensions',
+                 'array_stride', 'type_name')
+
+    def __init__(self, inst_name: str, name: str, desc: str, address_offset: int,
+                 total_size: int, width: int, reset: int, access: str, fields: list,
+                 array_dimensions: list = None, array_stride: int = None,
+                 type_name: str = None):
+        self.inst_name = inst_name
+        self.name = name
+        self.desc = desc
+        self.address_offset = address_offset
+        self.total_size = total_size
+        self.width = width
+        self.reset = reset
+        self.access = access
+        self.fields = fields
+        self.array_dimensions = array_dimensions
+        self.array_stride = array_stride
+        self.type_name = type_name
+
+class MemoryInfo:
+    """
+    Data of a single memory
+
+    size is the size in bytes of the memory (of one element of an array),
+    entries and width are its mementries and memwidth
+
+    virtual_registers are stored in memory order, their address_offset is
+    relative to the memory. Virtual register arrays are always collapsed.
+
+    array_dimensions and array_stride are only set for a memory array,
+    which is rendered once for all the elements
+    """
+    __slots__ = ('inst_name', 'name', 'desc', 'address_offset', 'size',
+                 'entries', 'width', 'access', 'virtual_registers',
+                 'array_dimensions', 'array_stride')
+
+    def __init__(self, inst_name: str, name: str, desc: str, address_offset: int,
+                 size: int, entries: int, width: int, access: str,
+                 virtual_registers: list, array_dimensions: list = None,
+                 array_stride: int = None):
+        self.inst_name = inst_name
+        self.name = name
+        self.desc = desc
+        self.address_offset = address_offset
+        self.size = size
+        self.entries = entries
+        self.width = width
+        self.access = access
+        self.virtual_registers = virtual_registers
+        self.array_dimensions = array_dimensions
+        self.array_stride = array_stride
+
+class AddrmapInfo:
+    """
+    Data of a single address map
+
+    registers and memories are stored in address map order
+
+    submaps are the (inst_name, address_offset, total_size) of the nested
+    address maps (rendered separately)
+
+    instance_bases are the absolute bases of all the instances of the
+    address map (one per element of the address map arrays it is part of),
+    the first one is base_address. The address map is rendered once.
+
+    The aggregates are computed once when the address map is extracted
+    (see set_aggregates):
+    bus_width is the max accesswidth/memwidth of its descendants in bytes,
+    register_count the number of registers (array elements counted),
+    extent the offset after its last register, memory or nested address
+    map and nonzero_resets the number of registers with a nonzero reset
+    """
+    __slots__ = ('name', 'desc', 'base_address', 'size', 'address_width',
+                 'registers', 'memories', 'submaps', 'instance_bases',
+                 'bus_width', 'register_count', 'extent', 'nonzero_resets')
+
+    def __init__(self, name: str, desc: str, base_address: int, size: int,
+                 address_width: int, registers: list, memories: list = None,
+                 submaps: list = None, instance_bases: list = None,
+                 bus_width: int = 0):
+        self.name = name
+        self.desc = desc
+        self.base_address = base_address
+        self.size = size
+        self.address_width = address_width
+        self.registers = registers
+        self.memories = memories if memories is not None else []
+        self.submaps = submaps if submaps is not None else []
+        self.instance_bases = instance_bases if instance_bases is not None else [base_address]
+        self.bus_width = bus_width
+        set_aggregates(self)
+
+############################################################################
+# Address span of the registers and memories (RegisterInfo, MemoryInfo)
+############################################################################
+def get_element_count(entry) -> int:
+    """
+    Returns the number of elements of a (collapsed) array, 1 otherwise
+    """
+    elements = 1
+    if entry.array_dimensions is not None:
+        for dim in entry.array_dimensions:
+            elements *= dim
+    return elements
+
+def get_entry_size(entry) -> int:
+    """
+    Returns the size in bytes of the entry (of one element of an array)
+    """
+    if isinstance(entry, MemoryInfo):
+        return entry.size
+    return entry.total_size
+
+def get_end_offset(entry) -> int:
+    """
+    Returns the offset after the entry (after the last element of an array)
+    """
+    end = entry.address_offset + get_entry_size(entry)
+    if entry.array_dimensions is not None:
+        end += (get_element_count(entry) - 1) * entry.array_stride
+    return end
+
+############################################################################
+# Per address map aggregates (AddrmapInfo)
+############################################################################
+def set_aggregates(addrmap: AddrmapInfo):
+    """
+    Computes the register count, extent and reset summary of the address map
+    """
+    addrmap.register_count = 0
+    addrmap.nonzero_resets = 0
+    addrmap.extent = 0
+
+    for reg in addrmap.registers:
+        elements = get_element_count(reg)
+        addrmap.register_count += elements
+        if reg.reset:
+            addrmap.nonzero_resets += elements
+
+    for entry in addrmap.registers + addrmap.memories:
+        addrmap.extent = max(addrmap.extent, get_end_offset(entry))
+
+    for inst_name, address_offset, total_size in addrmap.submaps:
+        addrmap.extent = max(addrmap.extent, address_offset + total_size)
+
+############################################################################
+# Content hash of the model records (and plain values)
+############################################################################
+def _as_tuple(item):
+    if hasattr(item, '__slots__'):
+        return tuple(_as_tuple(getattr(item, name)) for name in item.__slots__)
+    elif isinstance(item, list):
+        return tuple(_as_tuple(x) for x in item)
+    else:
+        return item
+
+def get_digest(*items) -> str:
+    return hashlib.sha256(repr(_as_tuple(list(items))).encode()).hexdigest()
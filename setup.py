@@ -21,8 +21,11 @@ setuptools.setup(
     packages=['peakrdl.pdf'],
     include_package_data=True,
     install_requires=[
-        "systemrdl-compiler>=1.12.0"
+        "systemrdl-compiler>=1.25.0"
     ],
+    extras_require={
+        "parallel": ["pypdf>=5.0.0"]
+    },
     classifiers=(
         "Development Status :: 5 - Production/Stable",
         "Programming Language :: Python",